@@ -2,23 +2,30 @@
 
 import argparse
 import configparser
+import enum
+import gzip
 import json
+import mmap
 import os
 import pathlib
 import pwd
+import random
 import re
+import shutil
 import socket
 import stat
-import subprocess
+import string
 import sys
 import tarfile
+import tempfile
 import textwrap
-import urllib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from contextlib import suppress
 from datetime import datetime
-from math import ceil
+from functools import lru_cache, partial
 from pathlib import Path
-from time import sleep
+from time import sleep, time
 
 try:
     import docker
@@ -26,6 +33,25 @@ except ImportError:
     print('\nPlease install the Python Docker module (pip3 install docker)\n')
     sys.exit(1)
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    print('\nPlease install the Python Requests module (pip3 install requests)\n')
+    sys.exit(1)
+
+# Optional, if available image packages are compressed with multi-threaded zstd instead of gzip
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Optional, if available the API specification is parsed and written with orjson instead of json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 __all__ = []
 __version__ = '1.5.2'  # See https://www.python.org/dev/peps/pep-0396/
 __date__ = '2021-09-10'
@@ -49,6 +75,242 @@ class Format:
     CURSOR_UP = '\033[F'
 
 
+class DedentHelpFormatter(argparse.RawTextHelpFormatter):
+    """ Help formatter that dedents the description and argument help when help is displayed instead of when added """
+
+    def _fill_text(self, text, width, indent):
+        return super()._fill_text(textwrap.dedent(text), width, indent)
+
+    def _get_help_string(self, action):
+        return textwrap.dedent(action.help)
+
+
+class Mode(enum.Flag):
+    """ Modes of operation requested by the command line arguments """
+
+    DEPLOY = enum.auto()
+    CLEAN = enum.auto()
+    INFO = enum.auto()
+    LOGS = enum.auto()
+    SAVE = enum.auto()
+    LOAD = enum.auto()
+    LIST = enum.auto()
+    UTILITY = SAVE | LOAD | LIST
+
+
+class KeepCharsTable(dict):
+    """ Table for str.translate that keeps only the specified characters, any other character is removed """
+
+    def __init__(self, keep_chars):
+        super().__init__((ord(char), ord(char)) for char in keep_chars)
+
+    def __missing__(self, key):
+        return None
+
+
+class GeneratorReader:
+    """ Minimal file like object to read from a generator of bytes, e.g. the stream from saving a Docker image """
+
+    def __init__(self, generator):
+        self.generator = generator
+        self.buffer = bytearray()
+
+    def read(self, size=-1):
+        """ Read up to size bytes, all remaining bytes if size is negative """
+
+        while size < 0 or len(self.buffer) < size:
+            try:
+                self.buffer += next(self.generator)
+            except StopIteration:
+                break
+
+        if size < 0:
+            size = len(self.buffer)
+
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+
+        return data
+
+
+# Pooled HTTP session, keep-alive allows connections to be reused across requests to the same host, e.g. the AWS
+# metadata endpoint and polling the REST server for the API specification
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+
+# Result of each url checked by internet_access(), a Future per url so concurrent checks of the same url share one probe
+URL_ACCESS = {}
+URL_ACCESS_LOCK = threading.Lock()
+
+# The web app and Swagger containers are started concurrently, guards updating their startedok status
+STARTED_LOCK = threading.Lock()
+
+# File in the per user cache dir caching the Senzing versions and image name lists between runs, and how long (secs) it's valid for
+VERSIONS_CACHE_FILE = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'senzinggo' / 'versions_cache.json'
+VERSIONS_CACHE_TTL = 3600
+
+# Connection strings in normal and cluster INI lines using localhost, e.g. CONNECTION=mysql://user:pw@localhost:3306/?schema=G2
+INI_LOCALHOST_RE = re.compile(r'^\s*(connection|db_1).*@(localhost|127\.0\.0\.1):', re.IGNORECASE)
+
+# Alias and name lines in db2dsdriver.cfg using localhost, e.g. <dsn alias="G2" name="G2" host="localhost" port="50000"/>
+DB2_CFG_LOCALHOST_RE = re.compile(rb'^[ \t]*<(?:dsn alias|database name)=[^\n]*(?:localhost|127\.0\.0\.1)',
+                                  re.IGNORECASE | re.MULTILINE)
+
+# Base volumes mounted in the REST API server container, host path under SENZING_ROOT and the path in the container
+API_BASE_VOLUMES = (('{senzing_root}', '/opt/senzing/g2'),
+                    ('{senzing_root}/data', '/opt/senzing/data'),
+                    ('{senzing_root}/etc', '/etc/opt/senzing'))
+
+# Container name prefixes used by SenzingGo and the docker_containers key each prefix belongs to
+CONTAINER_NAME_PREFIXES = {'SzGo-API-': 'restapi', 'SzGo-WEB-': 'webapp', 'SzGo-Swagger-': 'swagger'}
+
+# Valid chars in reference to Docker container names, used to keep only valid chars from the project name
+PROJ_NAME_TRANS = KeepCharsTable(string.ascii_letters + string.digits + '_.-')
+
+# Progress dots are only flushed per dot on a terminal, when piped they are written out with the next output
+STDOUT_IS_TTY = sys.stdout.isatty()
+
+# Messages that don't depend on runtime values, dedented once at import
+MSG_NO_HOST_NAME = textwrap.dedent(f'''\n\
+    {Colors.WARN}WARNING:{Colors.COLEND} Unable to detect a hostname, using localhost, this could cause issues.
+
+             If networking issues arise please set a hostname or try using the --host (-ho) argument
+             to specify host or ip address.
+    ''')
+
+MSG_NO_IP_ADDR = textwrap.dedent(f'''\n\
+    {Colors.WARN}WARNING:{Colors.COLEND} Unable to detect an IP address, using 127.0.0.1, this could cause issues.
+
+             If networking issues arise please check if a valid IP address is assigned.
+    ''')
+
+MSG_NO_API_SPEC = textwrap.dedent(f'''\n
+    {Colors.ERROR}ERROR:{Colors.COLEND} Unable to connect to or fetch API specification from REST server, cannot continue!
+    ''')
+
+MSG_PODMAN = textwrap.dedent(f'''\n
+    {Colors.ERROR}ERROR:{Colors.COLEND} Podman is being used instead of Docker, this is unsupported this tool requires Docker
+           https://docs.docker.com/engine/install/
+    ''')
+
+MSG_DOCKER_NOT_INSTALLED = textwrap.dedent(f'''\n\
+    {Colors.ERROR}ERROR:{Colors.COLEND} Docker doesn\'t appear to be installed or running and is required
+           https://docs.docker.com/engine/install/
+    ''')
+
+MSG_NO_DOCKERHUB = textwrap.dedent(f'''\n\
+    {Colors.WARN}WARNING:{Colors.COLEND} Cannot reach Senzing resources on the net, checking for available images...
+    ''')
+
+MSG_PACKAGE = textwrap.dedent(f'''\n\
+    {Colors.BLUE}INFO:{Colors.COLEND} This tool can be used on another system with internet access and Docker to package up the required Docker
+          images. This package can subsequently be used on this (or other machines) to make the required Docker images
+          available for use.
+
+          See --help" and the --saveImages (-si) and --loadImages (-li) arguments.
+    ''')
+
+# Messages with runtime values, dedented once at import and filled in with str.format() when used
+MSG_CONN_STR_TYPE = textwrap.dedent('''\n\
+    {Colors.ERROR}ERROR:{Colors.COLEND} Couldn\'t parse connection string and find the database type:
+           {connection_string}'
+    ''')
+
+MSG_CONN_STR_AT = textwrap.dedent('''\n\
+    {Colors.ERROR}ERROR:{Colors.COLEND} Couldn\'t parse connection string on @:
+           {connection_string}
+    ''')
+
+MSG_MYSQL_LIB = textwrap.dedent('''\n\
+    {Colors.WARN}WARNING:{Colors.COLEND} To use MySQL with this tool {lib_my_sql} is required to be in {senzing_root}/lib/
+             This allows the API server to use it inside the container. Senzing cannot distribute
+             this file, to use Senzing with MySQL this must be user installed.
+
+             {lib_my_sql} may already be installed in this machine if you have installed the MySQL
+             client. You can check with:
+
+                 sudo find / -name "libmysqlclient*"
+
+             If located, copy {lib_my_sql} to {senzing_root}/lib/, for example:
+
+                 cp /lib/x86_64-linux-gnu/libmysqlclient.so.21 {senzing_root}/lib/libmysqlclient.so.21
+
+             If {lib_my_sql} wasn't found install the MySQL client libraries appropriate for your distribution and create
+             the copy as above. For example, on Debian based systems:
+
+                 sudo apt install libmysqlclient21
+
+             {senzing_support}
+    ''')
+
+MSG_DB2_CLI_PATH = textwrap.dedent('''\n\
+    {Colors.WARN}WARNING:{Colors.COLEND} When the database type is Db2 use the --db2CliPath (-db2c) argument to specify the
+             location on this machine of the Db2 client CLI drivers. This allows the API server
+             to use them inside the container. Senzing cannot distribute this installation, to
+             use Senzing with Db2 this must be user installed.
+
+             This path should be the location of the Db2 client CLI drivers where the directories
+             such as /cfg and /lib are located, for example:
+
+                /opt/IBM/db2_cli_odbc_driver/odbc_cli/clidriver
+
+             https://www.ibm.com/docs/en/db2/11.5?topic=clients-data-server-drivers
+
+             {senzing_support}
+    ''')
+
+MSG_DB2_CLI_DIRS = textwrap.dedent('''\n\
+    {Colors.ERROR}ERROR:{Colors.COLEND} {db2_cli_path} doesn't appear to contain the expected directories such as /cfg
+           and /lib
+
+           Is {db2_cli_path} the path that contains the Db2 client CLI drivers and
+           directories such as /cfg and /lib?
+
+           {senzing_support}
+    ''')
+
+MSG_DB2_CFG_FILE = textwrap.dedent('''\n\
+    {Colors.ERROR}ERROR:{Colors.COLEND} {db2_cli_cfg_file} doesn't appear to exist and is required.
+
+           {senzing_support}
+    ''')
+
+MSG_CHOWN = textwrap.dedent('''\n\
+    {Colors.ERROR}ERROR:{Colors.COLEND} Cannot change ownership on {file_name}
+            {ex}
+    ''')
+
+MSG_CHMOD = textwrap.dedent('''\n\
+    {Colors.ERROR}ERROR:{Colors.COLEND} Cannot set permissions on {file_name}
+            {ex}
+    ''')
+
+MSG_DB2_LOCALHOST = textwrap.dedent('''\n\
+    {Colors.ERROR}ERROR:{Colors.COLEND} Host in the db2dsdriver.cfg file cannot use localhost or 127.0.0.1, use a true hostname or ip address
+           {line}
+    ''')
+
+# Optional notes in the resources message are either a line or move the cursor up to remove their line
+MSG_RESOURCES = textwrap.dedent('''\n\n\
+    {Colors.BLUE}{Colors.BOLD}Resources
+    ---------{Colors.COLEND}
+
+    {skip_health_note}
+    REST API Server: {endpoints[restapi][0]}
+                     {endpoints[restapi][1]}
+
+    Web App demo:    {endpoints[webapp][0]}
+                     {endpoints[webapp][1]}
+
+    Swagger GUI:     {endpoints[swagger][0]}
+                     {endpoints[swagger][1]}
+
+    {cloud_note}
+    {Colors.GREEN}Help:{Colors.COLEND} {help_url}
+    ''')
+
+
 def get_senzing_root(script_name):
     """ Get the SENZING_ROOT env var """
 
@@ -66,20 +328,73 @@ def get_senzing_root(script_name):
     return senz_root
 
 
+@lru_cache(maxsize=1)
+def on_aws():
+    """ Check for signs of running on AWS before waiting on requests to the instance metadata endpoint """
+
+    if os.environ.get('SENZINGGO_SKIP_AWS_META'):
+        return False
+
+    if os.environ.get('SENZINGGO_FORCE_AWS_META') or os.environ.get('AWS_EXECUTION_ENV'):
+        return True
+
+    # Xen based instances have a hypervisor uuid starting with ec2, Nitro based instances report Amazon EC2 as the vendor
+    with suppress(OSError):
+        with open('/sys/hypervisor/uuid', 'r') as uuid_file:
+            if uuid_file.read().lower().startswith('ec2'):
+                return True
+
+    with suppress(OSError):
+        with open('/sys/class/dmi/id/sys_vendor', 'r') as vendor_file:
+            if 'amazon' in vendor_file.read().lower():
+                return True
+
+    # EC2 compatible clouds, e.g. OpenStack, serve the same metadata endpoint, a quick connect finds them without waiting
+    # on the full request timeouts elsewhere
+    with suppress(OSError):
+        with socket.create_connection(('169.254.169.254', 80), timeout=0.2):
+            return True
+
+    return False
+
+
+@lru_cache(maxsize=1)
+def aws_metadata(tout=2):
+    """ Fetch the public hostname and IPv4 address from the AWS instance metadata, empty if not on AWS
+        Items that aren't available are None
+    """
+
+    def fetch_item(item):
+        """ Fetch an item from the instance metadata """
+
+        with suppress(Exception):
+            response = SESSION.get(f'http://169.254.169.254/latest/meta-data/{item}', timeout=tout)
+            response.raise_for_status()
+            return response.text
+
+        return None
+
+    # https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/instancedata-data-retrieval.html
+    # There is also the ec2-metadata tool that can report the instance data
+    if not on_aws():
+        return {}
+
+    # Request both items concurrently, on a slow or unresponsive endpoint the timeouts overlap
+    items = ('public-hostname', 'public-ipv4')
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        return dict(zip(items, executor.map(fetch_item, items)))
+
+
+@lru_cache(maxsize=1)
 def get_host_name(tout=2):
     """ Attempt to get fully qualified hostname """
 
     host_name = None
 
     # Test if on AWS and fetch AWS external hostname
-    # https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/instancedata-data-retrieval.html
-    # There is also the ec2-metadata tool that can report the instance data
-    host_end_point = 'http://169.254.169.254/latest/meta-data/public-hostname'
-
-    with suppress(Exception):
-        host_url = urllib.request.urlopen(host_end_point, timeout=tout)
-        public_host = host_url.read()
-        return public_host.decode(), True
+    public_host = aws_metadata(tout).get('public-hostname')
+    if public_host:
+        return public_host, True
 
     # FQDN
     with suppress(Exception):
@@ -92,31 +407,22 @@ def get_host_name(tout=2):
 
     # Otherwise set to localhost, can be overridden with the -ho CLI arg
     if not host_name:
-        print(textwrap.dedent(f'''\n\
-            {Colors.WARN}WARNING:{Colors.COLEND} Unable to detect a hostname, using localhost, this could cause issues.
-
-                     If networking issues arise please set a hostname or try using the --host (-ho) argument
-                     to specify host or ip address.
-                '''))
+        print(MSG_NO_HOST_NAME)
         host_name = 'localhost'
 
     return host_name, False
 
 
+@lru_cache(maxsize=1)
 def get_ip_addr(host_name, tout=2):
     """ Attempt to get IP address """
 
     ipv4 = None
 
     # Test if on AWS and fetch AWS external IPV4
-    # https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/instancedata-data-retrieval.html
-    # There is also the ec2-metadata tool that can report the instance data
-    ipv4_end_point = 'http://169.254.169.254/latest/meta-data/public-ipv4'
-
-    with suppress(Exception):
-        ipv4_url = urllib.request.urlopen(ipv4_end_point, timeout=tout)
-        public_ipv4 = ipv4_url.read()
-        return public_ipv4.decode()
+    public_ipv4 = aws_metadata(tout).get('public-ipv4')
+    if public_ipv4:
+        return public_ipv4
 
     # Try easy method
     with suppress(Exception):
@@ -130,11 +436,7 @@ def get_ip_addr(host_name, tout=2):
             ipv4 = sock.getsockname()[0]
 
     if not ipv4:
-        print(textwrap.dedent(f'''\n\
-            {Colors.WARN}WARNING:{Colors.COLEND} Unable to detect an IP address, using 127.0.0.1, this could cause issues.
-
-                     If networking issues arise please check if a valid IP address is assigned.
-                '''))
+        print(MSG_NO_IP_ADDR)
         ipv4 = '127.0.0.1'
 
     return ipv4
@@ -147,14 +449,10 @@ def ini_localhost_check(ini_file_name):
 
     with open(ini_file_name, 'r') as inifile:
         for line in inifile:
-            line_check = line.lstrip().lower()
-
             # Look for localhost in normal and cluster ini lines
-            if (line_check.startswith('connection') or line_check.startswith('db_1')) and ('@localhost:' in line_check or '@127.0.0.1:' in line_check):
-                print(textwrap.dedent(f'''\n\
-                    {Colors.ERROR}ERROR:{Colors.COLEND} Connection string cannot use localhost or 127.0.0.1, use a true hostname or ip address
-                           {line}
-                '''))
+            if INI_LOCALHOST_RE.match(line):
+                print(f'\n{Colors.ERROR}ERROR:{Colors.COLEND} Connection string cannot use localhost or 127.0.0.1, use a true hostname or ip address\n'
+                      f'       {line}')
                 sys.exit(1)
 
 
@@ -172,65 +470,142 @@ def convert_ini2json(ini_file_name):
     return ini_json
 
 
-def internet_access(url, retries=3, retries_start=None, tout=2, check_msg=True):
-    """ Test for access to resources that are required"""
+def progress_tick():
+    """ Print a progress dot while polling """
 
-    if check_msg:
-        print(f'\n\t{url}', end='', flush=True)
+    sys.stdout.write('.')
+    if STDOUT_IS_TTY:
+        sys.stdout.flush()
 
-    try:
-        urllib.request.urlopen(url, timeout=tout)
-        print(f'{Colors.GREEN} Available{Colors.COLEND}', end='')
-        return True
-    except (urllib.error.URLError, urllib.error.HTTPError, socket.timeout):
-        if retries > 1:
-            print('.', end='', flush=True)
-            retries -= 1
-            retries_start = retries if not retries_start else retries_start
-            sleep(1)
-            internet_access(url, retries, retries_start, check_msg=False)
 
-    if retries == retries_start:
-        print(f'{Colors.WARN} Unavailable{Colors.COLEND}', end='')
+def backoff(attempt, base=1.0, cap=30.0, jitter=0.5):
+    """ Exponential backoff with jitter, seconds to sleep before the next retry """
+
+    return min(cap, base * (1.3 ** attempt)) * (1 + random.uniform(-jitter, jitter))
+
+
+def internet_access(url, retries=3, tout=2):
+    """ Test for access to resources that are required, probing each url once """
+
+    with URL_ACCESS_LOCK:
+        access = URL_ACCESS.get(url)
+        probe = access is None
+        if probe:
+            access = URL_ACCESS[url] = Future()
+
+    # Always resolve the Future, otherwise other checks of the url wait on it forever
+    if probe:
+        try:
+            access.set_result(url_access(url, retries, tout))
+        except BaseException as ex:
+            access.set_exception(ex)
+
+    return access.result()
+
+
+def url_access(url, retries, tout):
+    """ Request url until it succeeds or retries are exhausted """
+
+    for attempt in range(retries):
+        try:
+            SESSION.get(url, timeout=tout).raise_for_status()
+            return True
+        except requests.exceptions.RequestException:
+            # Don't pause after the final attempt
+            if attempt < retries - 1:
+                sleep(backoff(attempt))
 
     return False
 
 
+def internet_checks(urls):
+    """ Test access to each url concurrently, reporting the results in the order requested """
+
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        futures = {url: executor.submit(internet_access, url) for url in urls}
+
+        for url, future in futures.items():
+            print(f'\n\t{url}', end='', flush=True)
+            results[url] = future.result()
+            print(f'{Colors.GREEN} Available{Colors.COLEND}' if results[url] else f'{Colors.WARN} Unavailable{Colors.COLEND}',
+                  end='', flush=True)
+
+    return results
+
+
 def get_api_spec(url, retries=5, tout=5):
-    """ Get the REST API specification from the REST server """
+    """ Get the REST API specification from the REST server, pausing ~50s in total between the retries """
 
     retry = retries
 
     while retry > 0:
 
         try:
-            api_spec_url = urllib.request.urlopen(url, timeout=tout)
-            api_spec = api_spec_url.read()
-            return api_spec
-        except (urllib.error.URLError, urllib.error.HTTPError, ConnectionResetError) as ex:
-            sleep_time = 5 * (retries - retry) if retry < ceil(retries/retry) else 5
-            print(textwrap.dedent(f'''\n
-                             {Colors.INFO}INFO:{Colors.COLEND} Waiting for API specification from REST server, pausing for {sleep_time}s before retry...                          
-                                       {ex}'''))
-            sleep(sleep_time)
+            api_spec_url = SESSION.get(url, timeout=tout)
+            api_spec_url.raise_for_status()
+            return api_spec_url.content
+        except (requests.exceptions.RequestException, ConnectionResetError) as ex:
             retry -= 1
+            # Don't pause after the final attempt
+            if retry > 0:
+                sleep_time = backoff(retries - retry - 1, base=8.0)
+                print(f'\n\n{Colors.INFO}INFO:{Colors.COLEND} Waiting for API specification from REST server, pausing for {sleep_time:.1f}s before retry...\n'
+                      f'          {ex}')
+                sleep(sleep_time)
         except Exception as ex:
-            print(textwrap.dedent(f'''\n
-                    {Colors.ERROR}ERROR:{Colors.COLEND} General error communicating with the REST server, cannot continue!
-                          {ex}
-            '''))
+            print(f'\n\n{Colors.ERROR}ERROR:{Colors.COLEND} General error communicating with the REST server, cannot continue!\n'
+                  f'      {ex}\n')
 
             sys.exit(1)
 
-    print(textwrap.dedent(f'''\n
-            {Colors.ERROR}ERROR:{Colors.COLEND} Unable to connect to or fetch API specification from REST server, cannot continue!
-            '''))
+    print(MSG_NO_API_SPEC)
 
     sys.exit(1)
 
 
-def parse_versions(url):
-    """ Parse the online Senzing Docker versions file into a dict to looking latest version numbers"""
+@lru_cache(maxsize=8)
+def fetch_page(url, cache_file=None, ttl=VERSIONS_CACHE_TTL):
+    """ Fetch a page, memoized for the life of the process and optionally cached to disk for ttl seconds """
+
+    cache = {}
+
+    # Only trust a cache file owned by this user, anything unexpected in it is ignored and the page fetched again
+    if cache_file:
+        with suppress(Exception):
+            with open(cache_file, 'r') as cf:
+                if os.fstat(cf.fileno()).st_uid == os.geteuid():
+                    cache = json.load(cf)
+
+        if not isinstance(cache, dict):
+            cache = {}
+
+        entry = cache.get(url)
+        if isinstance(entry, dict) and isinstance(entry.get('fetched'), (int, float)) and isinstance(entry.get('page'), str) \
+                and 0 <= time() - entry['fetched'] < ttl:
+            return entry['page']
+
+    response = SESSION.get(url)
+    response.raise_for_status()
+    page = response.text
+
+    # Failing to write the cache isn't an issue, e.g. the cache dir is owned by another user from a sudo run
+    if cache_file:
+        cache[url] = {'fetched': time(), 'page': page}
+        with suppress(OSError):
+            cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            cache_fd = os.open(cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_NOFOLLOW, 0o600)
+            with open(cache_fd, 'w', buffering=1024 * 1024) as cf:
+                json.dump(cache, cf)
+
+    return page
+
+
+def parse_versions(url, wanted=None):
+    """ Parse the online Senzing Docker versions file into a dict to looking latest version numbers
+        wanted is an optional set of the version variable names to keep, default is all of them
+    """
 
     # #!/usr/bin/env bash
     #
@@ -241,74 +616,61 @@ def parse_versions(url):
     # export SENZING_DOCKER_IMAGE_VERSION_APT_DOWNLOADER=1.1.3
 
     try:
-        # Read the versions data into a dict
-        response = urllib.request.urlopen(url)
-        page = response.read().decode().replace('export SENZING_', 'SENZING_')
-        versions = {kv.split('=')[0]: kv.split('=')[1] for kv in
-                    [line for line in page.split('\n') if line.startswith('SENZING_')]}
-    except urllib.error.HTTPError as ex:
-        print(textwrap.dedent(f'''\n\
-            {Colors.ERROR}ERROR:{Colors.COLEND} Fetching latest versions, the server couldn't fulfill the request.
-                   Error code: {ex.code})
-        '''))
+        page = fetch_page(url, VERSIONS_CACHE_FILE)
+    except requests.exceptions.HTTPError as ex:
+        print(f'\n{Colors.ERROR}ERROR:{Colors.COLEND} Fetching latest versions, the server couldn\'t fulfill the request.\n'
+              f'       Error code: {ex.response.status_code}\n')
         return False
-    except urllib.error.URLError as ex:
-        print(textwrap.dedent(f'''\n\
-            {Colors.ERROR}ERROR:{Colors.COLEND} Fetching latest versions, failed to reach a server.
-                   Reason: {ex.reason})
-        '''))
+    except requests.exceptions.RequestException as ex:
+        print(f'\n{Colors.ERROR}ERROR:{Colors.COLEND} Fetching latest versions, failed to reach a server.\n'
+              f'       Reason: {ex}\n')
         return False
 
+    # Read the versions data into a dict in a single pass, partition splits each line once without building a list
+    versions = {}
+    for line in page.splitlines():
+        if not line.startswith('export SENZING_'):
+            continue
+        key, _, value = line[len('export '):].partition('=')
+        if wanted is None or key in wanted:
+            versions[key] = value
+
     return versions
 
 
 def docker_checks(script_name):
-    """ Perform checks for Docker """
+    """ Perform checks for Docker and return a client to use """
 
     print('\nPerforming Docker checks...\n', flush=True)
 
-    # Is Docker installed?
-    try:
-        dversion = subprocess.run(['docker', '--version'], stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                                  encoding='utf8')
-        if 'podman' in dversion.stdout.lower():
-            print(textwrap.dedent(f'''\n
-                {Colors.ERROR}ERROR:{Colors.COLEND} Podman is being used instead of Docker, this is unsupported this tool requires Docker
-                       https://docs.docker.com/engine/install/
-            '''))
-            sys.exit(1)
-    except FileNotFoundError:
-        print(textwrap.dedent(f'''\n\
-                {Colors.ERROR}ERROR:{Colors.COLEND} Docker doesn\'t appear to be installed and is required
-                       https://docs.docker.com/engine/install/
-            '''))
+    docker_client = docker_init(script_name)
+
+    # Podman can provide a Docker compatible API, its version information reports a Podman Engine component
+    components = docker_client.version().get('Components') or []
+    if any('podman' in component.get('Name', '').lower() for component in components):
+        print(MSG_PODMAN)
         sys.exit(1)
 
-    # Not launched as sudo, check if user can use docker without sudo
-    if os.geteuid() != 0:
+    return docker_client
 
-        # Will succeed if the user can use docker without sudo - e.g. in the docker group, docker running rootless
-        check = subprocess.run(['docker', 'images'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding='utf8')
 
-        if check.returncode != 0:
-            if 'permission denied' and 'socket' in check.stderr:
-                print(
-                    f'\n{Colors.ERROR}ERROR:{Colors.COLEND} User cannot run Docker, you need to run with "sudo --preserve-env ./{script_name}" or be added to the docker group...\n')
-            else:
-                print(f'\n{Colors.ERROR}ERROR:{Colors.COLEND} {check.stderr}')
-            sys.exit(1)
-
-
-def docker_init():
+def docker_init(script_name):
     """ Initialise a Docker client """
 
+    # Instantiating the client requests the API version from the Docker daemon, this will fail if Docker isn't
+    # installed or running or the user doesn't have permission to use the Docker socket
     try:
         client = docker.from_env()
     except docker.errors.DockerException as ex:
-        print(textwrap.dedent(f'''\n\
-            {Colors.ERROR}ERROR:{Colors.COLEND} Unable to instantiate Docker, is the Docker service running?
-                   {ex}
-        '''))
+        # Not launched as sudo and can't use docker without sudo - e.g. not in the docker group
+        if os.geteuid() != 0 and 'permission denied' in str(ex).lower():
+            print(
+                f'\n{Colors.ERROR}ERROR:{Colors.COLEND} User cannot run Docker, you need to run with "sudo --preserve-env ./{script_name}" or be added to the docker group...\n')
+        elif 'no such file or directory' in str(ex).lower():
+            print(MSG_DOCKER_NOT_INSTALLED)
+        else:
+            print(f'\n{Colors.ERROR}ERROR:{Colors.COLEND} Unable to instantiate Docker, is the Docker service running?\n'
+                  f'       {ex}\n')
         sys.exit(1)
 
     return client
@@ -327,6 +689,7 @@ def pull_default_images(docker_client, docker_containers, no_web_app, no_swagger
 
     print('\nChecking and pulling Docker images, this may take many minutes...\n')
 
+    jobs = []
     for key, image_list in docker_containers.items():
 
         # Skip pulling images if CLI args request not to deploy
@@ -336,17 +699,25 @@ def pull_default_images(docker_client, docker_containers, no_web_app, no_swagger
         if no_swagger and image_list['imagename'] == 'swaggerapi/swagger-ui':
             continue
 
-        image_with_version = image_list['imagename'] + ':' + image_list['tag']
+        jobs.append((key, image_list['imagename'] + ':' + image_list['tag']))
 
-        did_pull = docker_pull(docker_client, image_with_version, force_pull)
-        if not did_pull and key == 'restapi':
-            print(
-                f'\n{Colors.ERROR}ERROR:{Colors.COLEND} Couldn\'t pull REST API Server image, can\'t continue without it!')
-            sys.exit(0)
-        elif did_pull == 'PULLED':
-            docker_containers[key]['imagepulled'] = True
+    # Pulls are network bound and the Docker daemon handles concurrent pulls of different images, pull them in parallel
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {executor.submit(docker_pull, docker_client, image_with_version, force_pull): key
+                   for key, image_with_version in jobs}
 
-        docker_containers[key]['imageavailable'] = True
+        for future in as_completed(futures):
+            key = futures[future]
+            did_pull = future.result()
+
+            if not did_pull and key == 'restapi':
+                print(
+                    f'\n{Colors.ERROR}ERROR:{Colors.COLEND} Couldn\'t pull REST API Server image, can\'t continue without it!')
+                sys.exit(0)
+            elif did_pull == 'PULLED':
+                docker_containers[key]['imagepulled'] = True
+
+            docker_containers[key]['imageavailable'] = True
 
 
 def docker_pull(docker_client, image, force_pull):
@@ -402,25 +773,24 @@ def docker_run(docker_client, docker_containers, skip_health, **kwargs):
 
         print(f'\n\t{msg}', end='', flush=True)
 
-        for r in range(loop_cnt):
-            cont_status = docker_client.containers.get(cont_name).status
-            cont_attrs = docker_client.containers.get(cont_name).attrs
+        cont = docker_client.containers.get(cont_name)
 
-            if check == 'running' and cont_status == 'running':
+        for r in range(loop_cnt):
+            if check == 'running' and cont.status == 'running':
                 return check
 
-            if check == 'healthy' and cont_attrs['State']['Health']['Status'] == 'healthy':
+            if check == 'healthy' and cont.attrs['State']['Health']['Status'] == 'healthy':
                 print()
                 return check
 
             sleep(t_sleep)
-            print('.', end='', flush=True)
-        print()
+            progress_tick()
 
-        cont_status = docker_client.containers.get(cont_name).status
-        cont_attrs = docker_client.containers.get(cont_name).attrs
+            # reload() refreshes status and attrs with a single request to the Docker daemon
+            cont.reload()
+        print(flush=True)
 
-        return cont_status if check == 'running' else cont_attrs['State']['Health']['Status']
+        return cont.status if check == 'running' else cont.attrs['State']['Health']['Status']
 
     def docker_logs(cont):
         """ Dump Docker logs for a container """
@@ -445,21 +815,24 @@ def docker_run(docker_client, docker_containers, skip_health, **kwargs):
         sys.exit(1)
 
     if not skip_health:
-        if status_wait(f'Waiting for container to start...', 'running', kwargs['name']) == 'exited':
-            print(f'\n\t{Colors.ERROR}ERROR:{Colors.COLEND} Container did not start successfully, status: {docker_client.containers.get(kwargs["name"]).status}')
-            docker_logs(docker_client.containers.get(kwargs['name']))
+        if status_wait(f'Waiting for {kwargs["name"]} to start...', 'running', kwargs['name']) == 'exited':
+            cont = docker_client.containers.get(kwargs['name'])
+            print(f'\n\t{Colors.ERROR}ERROR:{Colors.COLEND} Container did not start successfully, status: {cont.status}')
+            docker_logs(cont)
             sys.exit(1)
 
         # Container might not have HEALTHCHECK set in Docker file, if it does wait for it to become healthy
-        if docker_client.containers.get(kwargs['name']).attrs.get('State').get('Health', None):
-            if status_wait('Waiting for container to become healthy.', 'healthy', kwargs['name']) != 'healthy':
+        cont = docker_client.containers.get(kwargs['name'])
+        if cont.attrs.get('State').get('Health', None):
+            if status_wait(f'Waiting for {kwargs["name"]} to become healthy.', 'healthy', kwargs['name']) != 'healthy':
                 print(f'\n\t{Colors.WARN}WARNING:{Colors.COLEND} Container isn\'t healthy yet or failed, monitor with the command "docker logs {kwargs["name"]}"')
-                docker_logs(docker_client.containers.get(kwargs['name']))
+                docker_logs(cont)
         else:
-            print('\n\tThis container doesn\'t report health')
+            print(f'\n\t{kwargs["name"]} doesn\'t report health')
             print(f'\tUse the command "docker logs {kwargs["name"]}" to check status if issues arise ')
 
-        docker_containers[container_key]['startedok'] = True
+        with STARTED_LOCK:
+            docker_containers[container_key]['startedok'] = True
 
 
 def containers_stop_remove(senzing_proj_name,
@@ -479,7 +852,8 @@ def containers_stop_remove(senzing_proj_name,
     containers = docker_cont_list(docker_client, all_conts=True, cont_filters={'name': senzing_proj_name})
 
     # Base project container names
-    project_container_names = [values['containername'] for values in docker_containers.values()]
+    project_container_names = {values['containername'] for values in docker_containers.values()}
+    # Remove leading / https://github.com/docker/docker-py/pull/2634
     running_containers = [c.attrs['Name'].lstrip('/') for c in containers]
 
     # Don't print message if in startup and deleting any existing containers
@@ -497,14 +871,12 @@ def containers_stop_remove(senzing_proj_name,
     if containers_remove:
         spacer = '\n\t'
         print(f'{Colors.WARN}WARNING:{Colors.COLEND} Are you sure you want to delete the following containers? (Y/n):')
-        print(f'{spacer}{spacer.join(c for c in running_containers)}')
+        print(f'{spacer}{spacer.join(running_containers)}')
 
         if not input() in ['', 'y', 'Y', 'yes', 'YES']:
             sys.exit(0)
 
-    for cont in containers:
-        # Remove leading / https://github.com/docker/docker-py/pull/2634
-        cont_name = cont.attrs['Name'].lstrip('/')
+    for cont, cont_name in zip(containers, running_containers):
 
         if cont_name in project_container_names:
             print(f'\t{cont_name}')
@@ -513,10 +885,8 @@ def containers_stop_remove(senzing_proj_name,
             try:
                 cont.stop()
             except docker.errors.APIError as ex:
-                print(textwrap.dedent(f'''\n\
-                    {Colors.ERROR}ERROR:{Colors.COLEND} Failed to stop container
-                           {ex}
-                '''))
+                print(f'\n{Colors.ERROR}ERROR:{Colors.COLEND} Failed to stop container\n'
+                      f'       {ex}\n')
 
             if containers_remove or containers_remove_no_prompt or startup_remove or forced_remove:
                 print('\t\tRemoving...\n')
@@ -547,12 +917,8 @@ def containers_info(docker_client, docker_containers, senzing_proj_name, host_na
     def show_api_command(rest_api_command):
         """ Show API Server command for reference """
 
-        print(textwrap.dedent(f'''\n
-            Command the REST API Server container is starting with:
-
-                {' '.join([c for c in rest_api_command.split('  ') if c])}
-
-        '''))
+        print(f'\n\nCommand the REST API Server container is starting with:\n\n'
+              f'    {" ".join([c for c in rest_api_command.split("  ") if c])}\n\n')
 
         sys.exit(0)
 
@@ -565,28 +931,26 @@ def containers_info(docker_client, docker_containers, senzing_proj_name, host_na
         show_api_command(rest_api_command)
         sys.exit(0)
 
-    for name in [c.name for c in containers]:
+    for cont in containers:
+        name = cont.name
 
         # name is used as a key in the NetworkSettings -> Ports JSON object and is needed to find the host port the container
         # was started on
-        if name.startswith('SzGo-API-'):
-            key = 'restapi'
-        elif name.startswith('SzGo-WEB-'):
-            key = 'webapp'
-        elif name.startswith('SzGo-Swagger-'):
-            key = 'swagger'
-        else:
+        key = next((k for prefix, k in CONTAINER_NAME_PREFIXES.items() if name.startswith(prefix)), None)
+        if not key:
             # Only continue and list info for SenzingGo containers
             print(f'\nMatching containers found for {senzing_proj_name}, but they don\'t appear to be for SenzingGo')
             sys.exit(0)
 
-        status = docker_client.containers.get(name).attrs.get("State")["Status"]
+        # Non-sparse list() already inspected each container, use those attributes rather than a get() per lookup
+        attrs = cont.attrs
+        status = attrs["State"]["Status"]
         print(f'\nContainer: {name}\n')
-        print(f'\tImage:  {docker_client.containers.get(name).attrs.get("Config").get("Image")}')
+        print(f'\tImage:  {attrs["Config"]["Image"]}')
         print(f'\tStatus: {status}')
         if status == 'running':
-            host_port = docker_client.containers.get(name).attrs.get("NetworkSettings").get("Ports")[
-                str(docker_containers[key]["containerport"]) + "/tcp"][0]["HostPort"]
+            container_port = f'{docker_containers[key]["containerport"]}/tcp'
+            host_port = attrs["NetworkSettings"]["Ports"][container_port][0]["HostPort"]
             print(f'\tURL:    http://{host_name}:{host_port}')
 
     show_api_command(rest_api_command)
@@ -619,19 +983,14 @@ def list_image_names(docker_image_names, access, versions):
 
     try:
         # Read the docker images json file from github
-        response = urllib.request.urlopen(docker_image_names)
-        page = response.read().decode()
-    except urllib.error.HTTPError as ex:
-        print(textwrap.dedent(f'''\n\
-            {Colors.BLUE}INFO:{Colors.COLEND} Fetching image names, the server couldn't fulfill the request.
-                  Error code: {ex.code})
-            '''))
+        page = fetch_page(docker_image_names, VERSIONS_CACHE_FILE)
+    except requests.exceptions.HTTPError as ex:
+        print(f'\n{Colors.BLUE}INFO:{Colors.COLEND} Fetching image names, the server couldn\'t fulfill the request.\n'
+              f'      Error code: {ex.response.status_code}\n')
         return False
-    except urllib.error.URLError as ex:
-        print(textwrap.dedent(f'''\n\
-            {Colors.BLUE}INFO:{Colors.COLEND} Fetching image names, failed to reach a server.
-                  Reason: {ex.reason}
-            '''))
+    except requests.exceptions.RequestException as ex:
+        print(f'\n{Colors.BLUE}INFO:{Colors.COLEND} Fetching image names, failed to reach a server.\n'
+              f'      Reason: {ex}\n')
         return False
 
     docker_image_names = json.loads(page)
@@ -645,6 +1004,14 @@ def list_image_names(docker_image_names, access, versions):
         print(f'{k}:{versions.get(v["environment_variable"], "latest") if versions else "latest"}')
 
 
+def version_key(tag):
+    """ Sort key for image tags, numeric parts compare as numbers so 1.10.0 is newer than 1.9.0. Non-numeric parts,
+        e.g. latest, sort before numeric ones
+    """
+
+    return tuple((int(part), '') if part.isdigit() else (-1, part) for part in re.split(r'[.\-]', tag))
+
+
 def get_timestamp():
     """ Create timestamp """
 
@@ -655,10 +1022,6 @@ def save_images(docker_client, docker_containers, save_images, save_images_path,
     """ Package up base set or custom set of images to transfer and use on another system """
 
     avail_images_with_tag = []
-    packaged_files = []
-
-    # Set package path depending on if default value (str) was used or a path was specified (list)
-    package_path = save_images_path[0] if isinstance(save_images_path, list) else save_images_path
 
     if not access_dockerhub:
         print(
@@ -667,20 +1030,30 @@ def save_images(docker_client, docker_containers, save_images, save_images_path,
     # If a list of packages was specified pull them, otherwise no arguments on saveimages arg
     if len(save_images) > 0:
 
-        # If have internet access perform pull
-        # If don't have internet access check if each image exists, if it doesn't error as can't complete the request
-        for image in save_images:
+        def pull_and_check(image):
+            """ Pull if have internet access and check the image exists """
+
             if access_dockerhub:
                 docker_pull(docker_client, image, force_pull)
 
             try:
                 docker_client.images.get(image)
             except docker.errors.ImageNotFound:
-                print(
-                    f'\n{Colors.ERROR}ERROR:{Colors.COLEND} Image {image} isn\'t available to save, can\'t complete request.')
-                sys.exit(1)
+                return False
+
+            return True
+
+        # If have internet access perform pull
+        # If don't have internet access check if each image exists, if it doesn't error as can't complete the request
+        # Each image is independent, pull and check them in parallel and report in the order requested
+        with ThreadPoolExecutor(max_workers=min(3, len(save_images))) as executor:
+            for image, available in zip(save_images, executor.map(pull_and_check, save_images)):
+                if not available:
+                    print(
+                        f'\n{Colors.ERROR}ERROR:{Colors.COLEND} Image {image} isn\'t available to save, can\'t complete request.')
+                    sys.exit(1)
 
-            avail_images_with_tag.append(image)
+                avail_images_with_tag.append(image)
 
     # Normal packaging of the base images needed for rest, webapp, swagger
     else:
@@ -688,19 +1061,23 @@ def save_images(docker_client, docker_containers, save_images, save_images_path,
         if access_dockerhub:
             pull_default_images(docker_client, docker_containers, no_web_app, no_swagger, force_pull)
 
-        # Get a list of all images, only get the first tag entry [0] if there are > 1 tags
-        images = [i.tags[0] for i in docker_client.images.list()]
-        images.sort()
+        # Keep only the latest version of each image in a single pass. There could be multiple versions of an image on a
+        # system from earlier use or manual pulls. Only the first tag entry [0] is used if there are > 1 tags and
+        # untagged images are skipped
+        for docker_image in docker_client.images.list():
+            if not docker_image.tags:
+                continue
+
+            image = docker_image.tags[0]
 
-        # Use a dict to store only one image with the latest version from the sort, sort has latest version first
-        # There could be multiple versions of an image on a system from earlier use or manual pulls, get the latest one
-        for image in images:
             # There could be an image tagged to push to a local registry, e.g. localhost:5000/senzing/senzing-api-server:2.7.5
             # ignore these
             if image.count(':') > 1:
                 continue
-            name, version = image.split(':')
-            images_newest_dict[name] = version
+
+            name, _, version = image.partition(':')
+            if name not in images_newest_dict or version_key(version) > version_key(images_newest_dict[name]):
+                images_newest_dict[name] = version
 
         # Join the image name and version back into a unique list of images to package up
         avail_to_package = [k + ':' + v for k, v in images_newest_dict.items()]
@@ -717,39 +1094,46 @@ def save_images(docker_client, docker_containers, save_images, save_images_path,
         print(f'\n{Colors.ERROR}ERROR:{Colors.COLEND} There are no locally available images to save')
         sys.exit(1)
 
-    # Write each image out to a file, named as the image with / and : replaced with -
-    # The Docker API doesn't support saving multiple images to a single tar like native docker save command
-    for image in avail_images_with_tag:
-        package_file = f'{package_path}/SzGoPackage-{image.replace("/", "-").replace(":", "-")}.tar'
-        packaged_files.append(package_file)
+    def compress_stream(package_file):
+        """ Compress with zstd using all cores if available, otherwise single threaded gzip """
 
-        try:
-            with open(package_file, 'wb') as sf:
-                image_to_save = docker_client.images.get(image)
-                print(f'\nSaving {image} to {package_file}...')
-                for chunk in image_to_save.save(named=True):
-                    sf.write(chunk)
-        except FileNotFoundError as ex:
-            print(f'\n{Colors.ERROR}ERROR:{Colors.COLEND} {ex}')
-            sys.exit(1)
+        if zstandard:
+            return zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(package_file)
+
+        return gzip.GzipFile(fileobj=package_file, mode='wb', compresslevel=1)
 
-    compressed_package = f'{package_path}/SzGoImages_{get_timestamp()}.tgz'
-    print(f'\nCompressing saved images to {compressed_package}, this will take several minutes...')
+    compressed_package = f'{save_images_path}/SzGoImages_{get_timestamp()}.{"tar.zst" if zstandard else "tgz"}'
+    print(f'\nSaving and compressing images to {compressed_package}, this will take several minutes...')
 
-    # Add the image tar files to compressed tar and delete the image tar files
+    # The Docker API doesn't support saving multiple images to a single tar like native docker save. Each image is
+    # saved to a temporary file in the save path, as a tar member's size must be known before its data is written, then
+    # added to the package and removed before the next image is saved. Only one image tar is on disk at a time and the
+    # package is written in a single pass instead of saving every image and re-reading them all afterwards.
+    # The tar is written in streaming mode, strictly forward with a large buffer, compression is the dominant cost
+    # on multi-GB images. Without zstd gzip level 1 is used, several times faster than the default for a slightly
+    # larger package. The compressors emit small blocks, the package file buffer coalesces them into large writes
     try:
-        with tarfile.open(compressed_package, 'w:gz') as tar:
-            for name in packaged_files:
-                # arcname to specify only the file name to tar not the entire dir structure
-                tar.add(name, recursive=False, arcname=Path(name).name)
-                os.remove(name)
+        with open(compressed_package, 'wb', buffering=1024 * 1024) as package_file, \
+                compress_stream(package_file) as compressed_file, \
+                tarfile.open(fileobj=compressed_file, mode='w|', bufsize=1024 * 1024) as tar:
+            for image in avail_images_with_tag:
+                with tempfile.TemporaryFile(dir=save_images_path) as image_file:
+                    print(f'\nSaving {image}...')
+                    image_to_save = docker_client.images.get(image)
+                    shutil.copyfileobj(GeneratorReader(image_to_save.save(named=True)), image_file, 1024 * 1024)
+
+                    # Named as the image with / and : replaced with -
+                    tar_info = tarfile.TarInfo(name=f'SzGoPackage-{image.replace("/", "-").replace(":", "-")}.tar')
+                    tar_info.size = image_file.tell()
+                    tar_info.mtime = int(time())
+                    tar_info.mode = 0o644
+                    image_file.seek(0)
+                    tar.addfile(tar_info, fileobj=image_file)
     except FileNotFoundError as ex:
         print(f'\n{Colors.ERROR}ERROR:{Colors.COLEND} {ex}')
         sys.exit(1)
 
-    print(textwrap.dedent(f'''\n\
-        Move {compressed_package} to the system to load the images to and run this tool with --loadImages (-li)
-    '''))
+    print(f'\nMove {compressed_package} to the system to load the images to and run this tool with --loadImages (-li)\n')
 
 
 def load_images(docker_client, var_path, load_file_path):
@@ -761,25 +1145,49 @@ def load_images(docker_client, var_path, load_file_path):
     # Uncompress tar file to retrieve the tar image files
     print(f'Extracting Senzing Docker images from {file_to_extract}...')
 
+    # Packages are zstd compressed when zstandard was available to save images, otherwise gzip
+    if file_to_extract.name.endswith('.zst') and not zstandard:
+        print(f'\n{Colors.ERROR}ERROR:{Colors.COLEND} {file_to_extract.name} is zstd compressed, install the Python zstandard module (pip3 install zstandard) to load it')
+        sys.exit(1)
+
     try:
-        with tarfile.open(file_to_extract, 'r:gz') as tar:
-            tar.extractall(path=extract_path)
+        if file_to_extract.name.endswith('.zst'):
+            with open(file_to_extract, 'rb') as zst_file, \
+                    zstandard.ZstdDecompressor().stream_reader(zst_file) as decompressed_file, \
+                    tarfile.open(fileobj=decompressed_file, mode='r|') as tar:
+                tar.extractall(path=extract_path)
+        else:
+            with tarfile.open(file_to_extract, 'r:gz') as tar:
+                tar.extractall(path=extract_path)
     except FileNotFoundError as ex:
         print(f'\n{Colors.ERROR}ERROR:{Colors.COLEND} {ex}')
         sys.exit(1)
 
-    for image_file in os.scandir(extract_path):
-        print(f'\tLoading image file {image_file.name}')
+    def load_one(image_file):
+        """ Load an image file into Docker """
+
+        print(f'\tLoading image file {image_file.name}', flush=True)
+
+        # The image is sent to the daemon in small reads, a large buffer keeps the read syscalls to 1MiB each
+        with open(image_file, 'rb', buffering=1024 * 1024) as lf:
+            docker_client.images.load(lf)
+
+    # Close the directory handle before the extract dir is removed
+    with os.scandir(extract_path) as extracted:
+        image_files = list(extracted)
+
+    # Each load streams an image to the Docker daemon and waits for it to be imported, overlap the loads
+    with ThreadPoolExecutor(max_workers=min(4, len(image_files)) or 1) as executor:
         try:
-            with open(image_file, 'rb') as lf:
-                docker_client.images.load(lf)
+            for future in as_completed([executor.submit(load_one, image_file) for image_file in image_files]):
+                future.result()
         except FileNotFoundError as ex:
             print(f'\n{Colors.ERROR}ERROR:{Colors.COLEND} {ex}')
             sys.exit(1)
 
-    # Once completed remove the temp extract dir
+    # Once completed remove the temp extract dir and the image files in it
     with suppress(Exception):
-        os.remove(extract_path)
+        shutil.rmtree(extract_path, ignore_errors=True)
 
 
 def patch_ini_json(ini_json):
@@ -788,13 +1196,9 @@ def patch_ini_json(ini_json):
     def type_connection_split(connection_string):
         """ """
 
-        try:
-            dbtype, connection = connection_string.split(':', 1)
-        except ValueError:
-            print(textwrap.dedent(f'''\n\
-                {Colors.ERROR}ERROR:{Colors.COLEND} Couldn\'t parse connection string and find the database type:
-                       {connection_string}'
-            '''))
+        dbtype, sep, connection = connection_string.partition(':')
+        if not sep:
+            print(MSG_CONN_STR_TYPE.format(Colors=Colors, connection_string=connection_string))
             sys.exit(1)
 
         return dbtype, connection
@@ -804,18 +1208,27 @@ def patch_ini_json(ini_json):
 
         _, connection = type_connection_split(connection_string)
 
-        try:
-            _, conn_str = connection.split('@', 1)
-        except ValueError:
-            print(textwrap.dedent(f'''\n\
-                {Colors.ERROR}ERROR:{Colors.COLEND} Couldn\'t parse connection string on @:
-                       {conn_str}
-            '''))
+        _, sep, conn_str = connection.partition('@')
+        if not sep:
+            print(MSG_CONN_STR_AT.format(Colors=Colors, connection_string=connection))
             sys.exit(1)
 
-        conn_str_path = Path(conn_str).resolve().parent
+        # As written in the connection string, the path is resolved once when building the mount. Empty if the
+        # connection string only has a database file name
+        return os.path.dirname(conn_str)
+
+    def replace_path(ini_dict, old_path, new_path):
+        """ Replace the path of the database files in the connection strings of the ini dict, in place
+            Only the exact path after the @ is replaced, e.g. sqlite3://na:na@/old/path/G2C.db
+        """
 
-        return str(conn_str_path)
+        for key, value in ini_dict.items():
+            if isinstance(value, dict):
+                replace_path(value, old_path, new_path)
+            elif isinstance(value, str):
+                conn_prefix, sep, db_file = value.partition('@')
+                if sep and os.path.dirname(db_file) == old_path:
+                    ini_dict[key] = f'{conn_prefix}@{new_path}/{os.path.basename(db_file)}'
 
     # Correct ini parms for inside container and volume args on docker run command(s)
     ini_json['PIPELINE']['supportpath'] = '/opt/senzing/data'
@@ -833,9 +1246,8 @@ def patch_ini_json(ini_json):
         # This tool doesn't support each db file in different locations
         if ini_json['SQL'].get('backend', None) and ini_json['SQL']['backend'].lower() == 'hybrid':
 
-            # Get the unique set of cluster keys used in the ini [HYBRID] section, e.g. C1, C2
-            cluster_keys = [ini_json['HYBRID'][cluster_key] for cluster_key in ini_json['HYBRID']]
-            unique_cluster_keys = list(set(cluster_keys))
+            # Get the unique cluster keys used in the ini [HYBRID] section, e.g. C1, C2, keeping the order they appear in
+            unique_cluster_keys = list(dict.fromkeys(ini_json['HYBRID'].values()))
 
             # Get all the connection strings for each cluster key detected in [HYBRID], add base connection too
             # e.g. sqlite3://na:na@/home/ant/senzprojs/2_7_0-Release/var/sqlite/G2_RES.db
@@ -845,29 +1257,33 @@ def patch_ini_json(ini_json):
             # Get the path without the database file name for each connection string
             # e.g. /home/ant/senzprojs/2_7_0-Release/var/sqlite
             path_list = [get_path(path) for path in cluster_conn_strs]
-            unique_path_list = list(set(path_list))
+            unique_path_list = list(dict.fromkeys(path_list))
 
-            if len(unique_path_list) > 1:
+            # Only resolve the paths if they are written differently, they could still be the same path, e.g. a symlink
+            if len(unique_path_list) > 1 and len({os.path.realpath(path) for path in unique_path_list}) > 1:
                 print(f'\nWhen using a sqlite cluster, all database files must be in the same path:')
                 for path in unique_path_list:
                     print(f'\t{path}')
                 sys.exit(1)
 
-            # The host path to mount in the docker run volume arg is the only value on the list after it was made unique
-            host_path_for_volume = unique_path_list[0]
+            # The host path(s) as written in the ini, all are the same path after the check above
+            host_paths = unique_path_list
 
         # Not clustered
         else:
-            host_path_for_volume = get_path(base_conn_str)
+            host_paths = [get_path(base_conn_str)]
 
-        # Replace the original path(s) with the path inside the container
-        json_str = json.dumps(ini_json)
-        ini_json_patched = json.loads(json_str.replace(host_path_for_volume, '/var/opt/senzing'))
+        # Replace the original path(s) with the path inside the container. A database file name without a path is
+        # left as is
+        for host_path in host_paths:
+            if host_path:
+                replace_path(ini_json, host_path, '/var/opt/senzing')
 
-        # Build the values to use in the volume argument for the mount to return
-        mount_in_cont = [host_path_for_volume, {"bind": "/var/opt/senzing", "mode": "rw"}]
+        # Build the values to use in the volume argument for the mount to return, the host path to mount in the docker
+        # run volume arg is resolved once, the current directory if there is no path
+        mount_in_cont = [os.path.realpath(host_paths[0] or os.curdir), {"bind": "/var/opt/senzing", "mode": "rw"}]
 
-        return dbtype, ini_json_patched, mount_in_cont
+        return dbtype, ini_json, mount_in_cont
 
     # If not sqlite return the patched ini_json without meddling with connection strings
     return dbtype, ini_json, None
@@ -876,30 +1292,9 @@ def patch_ini_json(ini_json):
 def mysql_check(senzing_root, lib_my_sql, db_type, senzing_support):
     """ Checks for MySql """
 
-    lib_mysql_path = Path(f'{senzing_root}/lib/{lib_my_sql}')
-
-    if not lib_mysql_path.is_file():
-        print(textwrap.dedent(f'''\n\
-                                  {Colors.WARN}WARNING:{Colors.COLEND} To use MySQL with this tool {lib_my_sql} is required to be in {senzing_root}/lib/
-                                           This allows the API server to use it inside the container. Senzing cannot distribute
-                                           this file, to use Senzing with MySQL this must be user installed.
-
-                                           {lib_my_sql} may already be installed in this machine if you have installed the MySQL
-                                           client. You can check with:
-
-                                               sudo find / -name "libmysqlclient*"
-
-                                           If located, copy {lib_my_sql} to {senzing_root}/lib/, for example:
-
-                                               cp /lib/x86_64-linux-gnu/libmysqlclient.so.21 {senzing_root}/lib/libmysqlclient.so.21
-
-                                           If {lib_my_sql} wasn't found install the MySQL client libraries appropriate for your distribution and create
-                                           the copy as above. For example, on Debian based systems:
-
-                                               sudo apt install libmysqlclient21
-
-                                           {senzing_support}
-        '''))
+    if not os.path.isfile(f'{senzing_root}/lib/{lib_my_sql}'):
+        print(MSG_MYSQL_LIB.format(Colors=Colors, lib_my_sql=lib_my_sql, senzing_root=senzing_root,
+                                   senzing_support=senzing_support))
         sys.exit(1)
 
     print(
@@ -912,82 +1307,54 @@ def db2_check(args, senzing_support):
     try:
         db2_cli_path = args.db2CliPath[0]
     except TypeError:
-        print(textwrap.dedent(f'''\n\
-            {Colors.WARN}WARNING:{Colors.COLEND} When the database type is Db2 use the --db2CliPath (-db2c) argument to specify the
-                     location on this machine of the Db2 client CLI drivers. This allows the API server
-                     to use them inside the container. Senzing cannot distribute this installation, to
-                     use Senzing with Db2 this must be user installed.
-
-                     This path should be the location of the Db2 client CLI drivers where the directories
-                     such as /cfg and /lib are located, for example:
-
-                        /opt/IBM/db2_cli_odbc_driver/odbc_cli/clidriver
-
-                     https://www.ibm.com/docs/en/db2/11.5?topic=clients-data-server-drivers
-
-                     {senzing_support}
-        '''))
+        print(MSG_DB2_CLI_PATH.format(Colors=Colors, senzing_support=senzing_support))
 
         sys.exit(1)
 
-    db2_cli_path_lib = Path(f'{db2_cli_path}/lib')
-    db2_cli_cfg_file = Path(f'{db2_cli_path}/cfg/db2dsdriver.cfg')
+    db2_cli_cfg_file = f'{db2_cli_path}/cfg/db2dsdriver.cfg'
 
-    if not db2_cli_path_lib.is_dir():
-        print(textwrap.dedent(f'''\n\
-            {Colors.ERROR}ERROR:{Colors.COLEND} {str(db2_cli_path)} doesn't appear to contain the expected directories such as /cfg
-                   and /lib
+    if not os.path.isdir(f'{db2_cli_path}/lib'):
+        print(MSG_DB2_CLI_DIRS.format(Colors=Colors, db2_cli_path=db2_cli_path, senzing_support=senzing_support))
 
-                   Is {str(db2_cli_path)} the path that contains the Db2 client CLI drivers and
-                   directories such as /cfg and /lib?
+        sys.exit(1)
 
-                   {senzing_support}
-        '''))
+    if not os.path.isfile(db2_cli_cfg_file):
+        print(MSG_DB2_CFG_FILE.format(Colors=Colors, db2_cli_cfg_file=db2_cli_cfg_file, senzing_support=senzing_support))
 
         sys.exit(1)
 
-    if not db2_cli_cfg_file.is_file():
-        print(textwrap.dedent(f'''\n\
-            {Colors.ERROR}ERROR:{Colors.COLEND} {str(db2_cli_cfg_file)} doesn't appear to exist and is required.
+    # Look for localhost in alias and name cfg lines, scanning the whole file at once. An empty file can't be mapped
+    with open(db2_cli_cfg_file, 'rb') as cfgfile:
+        if os.fstat(cfgfile.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(cfgfile.fileno(), 0, access=mmap.ACCESS_READ) as cfg:
+            match = DB2_CFG_LOCALHOST_RE.search(cfg)
+            if match:
+                line_end = cfg.find(b'\n', match.end())
+                line = cfg[match.start():line_end if line_end != -1 else len(cfg)]
+                print(MSG_DB2_LOCALHOST.format(Colors=Colors, line=line.decode(errors='replace').strip()))
+                sys.exit(1)
 
-                   {senzing_support}
-        '''))
 
-        sys.exit(1)
+def mssql_check():
+    """ MSSQL isn't supported """
 
-    with open(db2_cli_cfg_file, 'r') as cfgfile:
-        for line in cfgfile:
-            line_check = line.lstrip().lower()
-
-            # Look for localhost in alias and name cfg lines
-            if (line_check.startswith('<dsn alias=') or line_check.startswith('<database name=')) and (
-                    'localhost' in line_check or '127.0.0.1' in line_check):
-                print(textwrap.dedent(f'''\n\
-                    {Colors.ERROR}ERROR:{Colors.COLEND} Host in the db2dsdriver.cfg file cannot use localhost or 127.0.0.1, use a true hostname or ip address
-                           {line.lstrip()}
-                '''))
-                sys.exit(1)
+    print(f'\n{Colors.ERROR}ERROR:{Colors.COLEND} MSSQL databases are not supported currently')
+    sys.exit(1)
 
 
 def package_msg():
     """ Message for packaging """
 
-    print(textwrap.dedent(f'''\n\
-        {Colors.BLUE}INFO:{Colors.COLEND} This tool can be used on another system with internet access and Docker to package up the required Docker
-              images. This package can subsequently be used on this (or other machines) to make the required Docker images
-              available for use.
-
-              See --help" and the --saveImages (-si) and --loadImages (-li) arguments.
-        '''))
+    print(MSG_PACKAGE)
 
 
 def get_senzing_proj_name(root_path):
     """ Get the project name from root path running in """
 
     # Keep only valid chars from the project name for use in the suffix for containers
-    # Valid chars in reference to Docker container names
-    chars_remove = re.compile('[^a-zA-Z0-9_.-]')
-    proj_name_clean = chars_remove.sub('', root_path)
+    proj_name_clean = root_path.translate(PROJ_NAME_TRANS)
 
     if root_path != proj_name_clean:
         print(
@@ -997,212 +1364,144 @@ def get_senzing_proj_name(root_path):
     return root_path
 
 
-def main():
-    """ """
-
-    SCRIPT_NAME = Path(__file__).name
-    SCRIPT_STEM = Path(__file__).stem
-
-    # Set var path to /tmp first to use with --saveImages if SENZING_ROOT isn't set and working in a project
-    # i.e., use SenzingGo to only do save and load images independent of having a Senzing API install & project
-    # Set project and host names to blank to also allow independent use of SenzingGo
-    SENZING_VAR_PATH = pathlib.Path('/tmp')
-    senzing_proj_name = host_name = ''
-
-    # Check setup env has been run and determine project name from path
-    SENZING_ROOT = get_senzing_root(SCRIPT_NAME)
+def first_arg(value):
+    """ Arguments using nargs=1 are a list when specified and the default value when not, return the value either way """
 
-    # Only perform the following if SENZING_ROOT is set and thus working with a Senzing project and not independent
-    # with --saveImages / --loadImages
-    if SENZING_ROOT:
-        SENZING_ROOT_PATH = pathlib.PurePath(SENZING_ROOT)
-        SENZING_VAR_PATH = SENZING_ROOT_PATH / 'var'
-        senzing_proj_name = get_senzing_proj_name(SENZING_ROOT_PATH.name)
+    return value[0] if isinstance(value, list) else value
 
-        SZGO_REST_JSON = 'SzGo-rest-api.json'
-        SZGO_REST_SPEC = 'specifications/open-api'
-
-        LIB_MY_SQL = 'libmysqlclient.so.21'
 
-    # URLs for required assets
-    DOCKER_LATEST_URL = 'https://raw.githubusercontent.com/Senzing/knowledge-base/main/lists/docker-versions-latest.sh'
-    DOCKER_STABLE_URL = 'https://raw.githubusercontent.com/Senzing/knowledge-base/main/lists/docker-versions-stable.sh'
-    DOCKERHUB_URL = 'https://hub.docker.com/u/senzing/'
-    DOCKER_IMAGE_NAMES = 'https://raw.githubusercontent.com/Senzing/knowledge-base/main/lists/docker-image-names.json'
-    # SENZING_AIR_GAP_INSTALL = 'https://senzing.zendesk.com/hc/en-us/articles/360039787373-Install-Air-Gapped-Systems'
-
-    SENZING_SUPPORT = 'For further assistance contact support@senzing.com'
-    SZGO_HELP = 'https://github.com/Senzing/senzinggo'
-
-    # Dict of the containers required and details to use, names match project path/name to allow >1 project and containers
-    docker_containers = \
-        {'restapi':
-            {
-                'imagename': 'senzing/senzing-api-server',
-                'latestsuffix': 'SENZING_DOCKER_IMAGE_VERSION_SENZING_API_SERVER',
-                'containername': f'SzGo-API-{senzing_proj_name}',
-                'containerport': 8250,
-                'hostport': 8250,
-                'imagepulled': False,
-                'imageavailable': None,
-                'tag': None,
-                'startedok': None
-            },
-         'webapp':
-            {
-                'imagename': 'senzing/entity-search-web-app',
-                'latestsuffix': 'SENZING_DOCKER_IMAGE_VERSION_ENTITY_SEARCH_WEB_APP',
-                'containername': f'SzGo-WEB-{senzing_proj_name}',
-                'containerport': 8081,
-                'hostport': 8251,
-                'imagepulled': False,
-                'imageavailable': None,
-                'tag': None,
-                'startedok': None
-            },
-         'swagger':
-            {
-                'imagename': 'swaggerapi/swagger-ui',
-                'latestsuffix': 'SENZING_DOCKER_IMAGE_VERSION_SWAGGERAPI_SWAGGER_UI',
-                'containername': f'SzGo-Swagger-{senzing_proj_name}',
-                'containerport': 8080,
-                'hostport': 9180,
-                'imagepulled': False,
-                'imageavailable': None,
-                'tag': None,
-                'startedok': None
-            }
-         }
+def build_parser(docker_containers, senzing_proj_name, var_path, script_stem, szgo_help):
+    """ Build the command line argument parser """
 
     # Don't allow argparse to create abbreviations of options - allow_abbrev
-    szgo_parser = argparse.ArgumentParser(formatter_class=argparse.RawTextHelpFormatter,
+    szgo_parser = argparse.ArgumentParser(formatter_class=DedentHelpFormatter,
                                           allow_abbrev=False,
-                                          description=textwrap.dedent(f'''
+                                          description=f'''
                                             Utility to rapidly deploy Docker containers for REST API server, Entity Search App and Swagger UI
 
-                                            Additional information: {SZGO_HELP}
-                                            '''))
+                                            Additional information: {szgo_help}
+                                            ''')
 
     szgo_parser.add_argument('-c', '--iniFile', default=None, nargs=1,
-                             help=textwrap.dedent('''\
+                             help='''\
                                 Path and file name of optional G2Module.ini to use.
 
-                                '''))
+                                ''')
 
     szgo_parser.add_argument('-ap', '--apiHostPort', type=int, default=docker_containers['restapi']['hostport'],
                              nargs=1, metavar='PORT',
-                             help=textwrap.dedent('''\
+                             help='''\
                                 Port number of the REST API server, default=%(default)s
 
-                                '''))
+                                ''')
 
     szgo_parser.add_argument('-wp', '--webAppHostPort', type=int, default=docker_containers['webapp']['hostport'],
                              nargs=1, metavar='PORT',
-                             help=textwrap.dedent('''\
+                             help='''\
                                 Port number of the Search Web App demo, default=%(default)s
 
-                                '''))
+                                ''')
 
     szgo_parser.add_argument('-sp', '--swaggerHostPort', type=int, default=docker_containers['swagger']['hostport'],
                              nargs=1, metavar='PORT',
-                             help=textwrap.dedent('''\
+                             help='''\
                                 Port number of Swagger UI, default=%(default)s
 
-                                '''))
+                                ''')
 
     szgo_parser.add_argument('-nwa', '--noWebApp', default=False, action='store_true',
-                             help=textwrap.dedent('''\
+                             help='''\
                                 Don\'t deploy the Search Web App demo
 
-                                '''))
+                                ''')
 
     szgo_parser.add_argument('-nsw', '--noSwagger', default=False, action='store_true',
-                             help=textwrap.dedent('''\
+                             help='''\
                                 Don\'t deploy the Swagger UI
 
-                                '''))
+                                ''')
 
     stop_group = szgo_parser.add_mutually_exclusive_group()
     stop_group.add_argument('-s', '--contStop', default=False, action='store_true',
-                            help=textwrap.dedent(f'''\
+                            help=f'''\
                                 Stop any Docker containers named *{senzing_proj_name}
 
-                                '''))
+                                ''')
 
     stop_group.add_argument('-r', '--contRemove', default=False, action='store_true',
-                            help=textwrap.dedent(f'''\
+                            help=f'''\
                                 Stop and remove any Docker containers named *{senzing_proj_name}
 
-                                '''))
+                                ''')
 
     stop_group.add_argument('-rn', '--contRemoveNoPrompt', default=False, action='store_true',
-                            help=textwrap.dedent(f'''\
+                            help=f'''\
                                 Stop and remove any Docker containers named *{senzing_proj_name} without prompting
 
-                                '''))
+                                ''')
 
     szgo_parser.add_argument('-i', '--info', default=False, action='store_true',
-                             help=textwrap.dedent('''\
+                             help='''\
                                 Display info for running containers for this project
 
-                                '''))
+                                ''')
 
     szgo_parser.add_argument('-l', '--logs', type=str, const='SzGo', nargs='?', metavar='STRING',
-                             help=textwrap.dedent('''\
+                             help='''\
                                 Display logs for running container(s), use partial string to match multiple containers, default=%(const)s
 
-                                '''))
+                                ''')
 
     # Use Suppress to not have in namespace unless specified
     szgo_parser.add_argument('-si', '--saveImages', default=argparse.SUPPRESS, nargs='*', metavar='IMAGE',
-                             help=textwrap.dedent(f'''\
-                                Save {SCRIPT_STEM} Docker images for loading on another machine, e.g. air gapped systems
+                             help=f'''\
+                                Save {script_stem} Docker images for loading on another machine, e.g. air gapped systems
 
                                 Unless instructed by Senzing support no arguments are required.
 
-                                '''))
+                                ''')
 
-    szgo_parser.add_argument('-sip', '--saveImagesPath', default=SENZING_VAR_PATH, nargs=1, metavar='PATH',
-                             help=textwrap.dedent('''\
+    szgo_parser.add_argument('-sip', '--saveImagesPath', default=var_path, nargs=1, metavar='PATH',
+                             help='''\
                                 Path for saving a Docker images package to, default=%(default)s
 
-                                '''))
+                                ''')
 
     szgo_parser.add_argument('-li', '--loadImages', type=str, nargs=1, metavar='FILE',
-                             help=textwrap.dedent(f'''\
-                                File to load {SCRIPT_STEM} Docker images from to this machine, e.g. air gapped systems
+                             help=f'''\
+                                File to load {script_stem} Docker images from to this machine, e.g. air gapped systems
 
-                                '''))
+                                ''')
 
     szgo_parser.add_argument('-aa', '--apiAdmin', default=False, action='store_true',
-                             help=textwrap.dedent('''\
+                             help='''\
                                 Enable admin mode on the API Server
 
-                                '''))
+                                ''')
 
     szgo_parser.add_argument('-n', '--dockNet', type=str, default='szgo-network', nargs='?', metavar='NAME',
-                             help=textwrap.dedent('''\
+                             help='''\
                                 Name of a Docker network to create or use, default=%(default)s
 
-                                '''))
+                                ''')
 
     szgo_parser.add_argument('-ho', '--host', type=str, default=None, nargs='?',
-                             help=textwrap.dedent('''\
+                             help='''\
                                 Hostname, only use if tool can\'t determine correctly
 
-                                '''))
+                                ''')
 
     szgo_parser.add_argument('-ps', '--projectSuffix', type=str, default=senzing_proj_name, nargs=1, metavar='SUFFIX',
-                             help=textwrap.dedent(f'''\
+                             help=f'''\
                                 Suffix to use for container names, default=%(default)s
 
-                                '''))
+                                ''')
 
     szgo_parser.add_argument('-db2c', '--db2CliPath', default=None, nargs=1,
-                             help=textwrap.dedent('''\
+                             help='''\
                                 Path to Db2 client CLI driver when using a Db2 database as the Senzing repository
 
-                                '''))
+                                ''')
 
     # Undocumented args - advanced usage with guidance from Senzing support
     szgo_parser.add_argument('-il', '--imagesList', default=False, action='store_true', help=argparse.SUPPRESS)
@@ -1226,15 +1525,114 @@ def main():
     # This can be removed when stable Docker images move over to API Server V3, will only work with Senzing V2 projects
     szgo_parser.add_argument('-av2', '--apiV2', default=False, action='store_true', help=argparse.SUPPRESS)
 
+    return szgo_parser
+
+
+def main():
+    """ """
+
+    SCRIPT_NAME = Path(__file__).name
+    SCRIPT_STEM = Path(__file__).stem
+
+    # Set var path to /tmp first to use with --saveImages if SENZING_ROOT isn't set and working in a project
+    # i.e., use SenzingGo to only do save and load images independent of having a Senzing API install & project
+    # Set project and host names to blank to also allow independent use of SenzingGo
+    SENZING_VAR_PATH = pathlib.Path('/tmp')
+    senzing_proj_name = host_name = ''
+
+    # Check setup env has been run and determine project name from path
+    SENZING_ROOT = get_senzing_root(SCRIPT_NAME)
+
+    # Only perform the following if SENZING_ROOT is set and thus working with a Senzing project and not independent
+    # with --saveImages / --loadImages
+    if SENZING_ROOT:
+        SENZING_ROOT_PATH = pathlib.PurePath(SENZING_ROOT)
+        SENZING_VAR_PATH = SENZING_ROOT_PATH / 'var'
+        senzing_proj_name = get_senzing_proj_name(SENZING_ROOT_PATH.name)
+
+        SZGO_REST_JSON = 'SzGo-rest-api.json'
+        SZGO_REST_SPEC = 'specifications/open-api'
+
+        LIB_MY_SQL = 'libmysqlclient.so.21'
+
+    # URLs for required assets
+    DOCKER_LATEST_URL = 'https://raw.githubusercontent.com/Senzing/knowledge-base/main/lists/docker-versions-latest.sh'
+    DOCKER_STABLE_URL = 'https://raw.githubusercontent.com/Senzing/knowledge-base/main/lists/docker-versions-stable.sh'
+    DOCKERHUB_URL = 'https://hub.docker.com/u/senzing/'
+    DOCKER_IMAGE_NAMES = 'https://raw.githubusercontent.com/Senzing/knowledge-base/main/lists/docker-image-names.json'
+    # SENZING_AIR_GAP_INSTALL = 'https://senzing.zendesk.com/hc/en-us/articles/360039787373-Install-Air-Gapped-Systems'
+
+    SENZING_SUPPORT = 'For further assistance contact support@senzing.com'
+    SZGO_HELP = 'https://github.com/Senzing/senzinggo'
+
+    # Dict of the containers required and details to use, container names are set from the project suffix once args are parsed
+    # and match project path/name to allow >1 project and containers
+    docker_containers = \
+        {'restapi':
+            {
+                'imagename': 'senzing/senzing-api-server',
+                'latestsuffix': 'SENZING_DOCKER_IMAGE_VERSION_SENZING_API_SERVER',
+                'containername': None,
+                'containerport': 8250,
+                'hostport': 8250,
+                'imagepulled': False,
+                'imageavailable': None,
+                'tag': None,
+                'startedok': None
+            },
+         'webapp':
+            {
+                'imagename': 'senzing/entity-search-web-app',
+                'latestsuffix': 'SENZING_DOCKER_IMAGE_VERSION_ENTITY_SEARCH_WEB_APP',
+                'containername': None,
+                'containerport': 8081,
+                'hostport': 8251,
+                'imagepulled': False,
+                'imageavailable': None,
+                'tag': None,
+                'startedok': None
+            },
+         'swagger':
+            {
+                'imagename': 'swaggerapi/swagger-ui',
+                'latestsuffix': 'SENZING_DOCKER_IMAGE_VERSION_SWAGGERAPI_SWAGGER_UI',
+                'containername': None,
+                'containerport': 8080,
+                'hostport': 9180,
+                'imagepulled': False,
+                'imageavailable': None,
+                'tag': None,
+                'startedok': None
+            }
+         }
+
+    szgo_parser = build_parser(docker_containers, senzing_proj_name, SENZING_VAR_PATH, SCRIPT_STEM, SZGO_HELP)
     args = szgo_parser.parse_args()
 
+    # Normalise the single value arguments once
+    for arg_name in ('apiHostPort', 'webAppHostPort', 'swaggerHostPort', 'projectSuffix', 'saveImagesPath'):
+        setattr(args, arg_name, first_arg(getattr(args, arg_name)))
+
+    # Decide the mode of operation once, saveImages is only set on args if used (default=argparse.SUPPRESS)
+    mode = Mode(0)
+    for requested, flag in ((hasattr(args, 'saveImages'), Mode.SAVE),
+                            (args.loadImages, Mode.LOAD),
+                            (args.imagesList, Mode.LIST),
+                            (args.contStop or args.contRemove or args.contRemoveNoPrompt, Mode.CLEAN),
+                            (args.info, Mode.INFO),
+                            (args.logs, Mode.LOGS)):
+        if requested:
+            mode |= flag
+    if not mode & Mode.UTILITY:
+        mode |= Mode.DEPLOY
+
     # Warning message printed by get_senzing_root(), if SENZING_ROOT isn't set only allow
     # save / load images mode (and non-documented images list)
-    if not hasattr(args, 'saveImages') and not args.loadImages and not args.imagesList and not SENZING_ROOT:
+    if Mode.DEPLOY in mode and not SENZING_ROOT:
         sys.exit(1)
 
     # If running in deployment mode process the INI file for use
-    if not hasattr(args, 'saveImages') and not args.loadImages and not args.imagesList:
+    if Mode.DEPLOY in mode:
 
         # Import G2Paths after the get_senzing_root() check. G2Paths checks for SENZING_ROOT and exits if not set
         import G2Paths
@@ -1285,30 +1683,27 @@ def main():
     if host_name == 'localhost' or ip_addr == '127.0.0.1':
         sleep(3)
 
-    # Check Docker Docker is installed, sudo access?
-    docker_checks(SCRIPT_NAME)
-    docker_client = docker_init()
+    # Check Docker is installed, sudo access? and initialise a Docker client
+    docker_client = docker_checks(SCRIPT_NAME)
 
     # Create Docker network if it doesn't exist
-    if not args.contStop and not args.contRemove and not args.contRemoveNoPrompt and not args.info \
-            and not args.logs and not hasattr(args, 'saveImages') and not args.loadImages and not args.imagesList:
+    if mode == Mode.DEPLOY:
         docker_net(docker_client, args.dockNet)
 
     # Set the project name and container names when projectSuffix is used, otherwise uses default from projectSuffix
-    senzing_proj_name = args.projectSuffix if isinstance(args.projectSuffix, str) else args.projectSuffix[0]
-    docker_containers['restapi']['containername'] = f'SzGo-API-{senzing_proj_name}'
-    docker_containers['webapp']['containername'] = f'SzGo-WEB-{senzing_proj_name}'
-    docker_containers['swagger']['containername'] = f'SzGo-Swagger-{senzing_proj_name}'
+    senzing_proj_name = args.projectSuffix
+    for prefix, key in CONTAINER_NAME_PREFIXES.items():
+        docker_containers[key]['containername'] = f'{prefix}{senzing_proj_name}'
 
     # Do clean up instead of deployment
-    if args.contStop or args.contRemove or args.contRemoveNoPrompt:
+    if Mode.CLEAN in mode:
         containers_stop_remove(senzing_proj_name, docker_client, docker_containers, args.contRemove,
                                args.contRemoveNoPrompt, args.dockNet)
         sys.exit(0)
 
     # Always stop and remove any existing containers if not performing a non-deploy option
     # Different args could be used between runs, want them to take effect with a new container instance
-    if not hasattr(args, 'saveImages') and not args.loadImages and not args.info and not args.logs and not args.imagesList:
+    if Mode.DEPLOY in mode and not mode & (Mode.INFO | Mode.LOGS):
         containers_stop_remove(senzing_proj_name, docker_client, docker_containers, args.contRemove,
                                args.contRemoveNoPrompt, args.dockNet, startup_remove=True)
 
@@ -1334,16 +1729,21 @@ def main():
     # If the use of the stable Docker list is requested use it
     docker_versions_url = DOCKER_STABLE_URL if args.stableDocker else DOCKER_LATEST_URL
 
+    # The versions list isn't needed when all the tags are specified, unless listing images which shows all the versions
+    versions_needed = args.imagesList or not (args.apiTag and args.webAppTag and args.swaggerTag)
+
     # Check can reach net and access destinations of required resources?
     print('Checking for internet access and Senzing resources...', flush=True)
-    access_versions = internet_access(docker_versions_url)
-    access_dockerhub = internet_access(DOCKERHUB_URL)
-    if args.imagesList:
-        access_imagesList = internet_access(DOCKER_IMAGE_NAMES)
+    access = internet_checks(([docker_versions_url] if versions_needed else []) + [DOCKERHUB_URL]
+                             + ([DOCKER_IMAGE_NAMES] if args.imagesList else []))
+    access_versions = access.get(docker_versions_url, False)
+    access_dockerhub = access[DOCKERHUB_URL]
+    access_imagesList = access.get(DOCKER_IMAGE_NAMES)
     print('\n')
 
-    # Try and fetch the latest docker image versions
-    versions = parse_versions(docker_versions_url) if access_versions else {}
+    # Try and fetch the latest docker image versions, only the versions of the images deployed unless listing images
+    versions_wanted = None if args.imagesList else {container['latestsuffix'] for container in docker_containers.values()}
+    versions = parse_versions(docker_versions_url, versions_wanted) if access_versions else {}
 
     # Add the current pinned version numbers from docker_versions_url to the dictionary if available, else use latest
     docker_containers['restapi']['tag'] = versions[docker_containers['restapi']['latestsuffix']] if versions else 'latest'
@@ -1359,7 +1759,7 @@ def main():
         docker_containers['swagger']['tag'] = args.swaggerTag
 
     # Package images to use on another system
-    if hasattr(args, 'saveImages'):
+    if Mode.SAVE in mode:
         save_images(docker_client, docker_containers, args.saveImages, args.saveImagesPath, access_dockerhub, args.noWebApp, args.noSwagger, args.forcePull)
         sys.exit(0)
 
@@ -1368,25 +1768,24 @@ def main():
         list_image_names(DOCKER_IMAGE_NAMES, access_imagesList, versions)
         sys.exit(0)
 
-    # Check if images exist already, add to dictionary for reference
-    avail_images = []
-
-    # Return list of repo names/tags, each could be tagged >1 and contain a list with >1 entries
-    for i_list in [i.tags for i in docker_client.images.list()]:
-        for image in i_list:
-            avail_images.append(image.split(':')[0])
-
-    docker_containers['restapi']['imageavailable'] = True if docker_containers['restapi']['imagename'] in avail_images else False
-    docker_containers['webapp']['imageavailable'] = True if docker_containers['webapp']['imagename'] in avail_images else False
-    docker_containers['swagger']['imageavailable'] = True if docker_containers['swagger']['imagename'] in avail_images else False
-
     # If can reach Docker Hub always try and pull images, otherwise detect if might be able to continue with installed local assets
+    # When pulling, pull_default_images() sets imageavailable so there is no need to list the local images first
     if access_dockerhub:
         pull_default_images(docker_client, docker_containers, args.noWebApp, args.noSwagger, args.forcePull)
     else:
-        print(textwrap.dedent(f'''\n\
-            {Colors.WARN}WARNING:{Colors.COLEND} Cannot reach Senzing resources on the net, checking for available images...
-        '''))
+        print(MSG_NO_DOCKERHUB)
+
+        # Check if images exist already, add to dictionary for reference
+        # Tags of each repo name from a single listing of the local images, each image could be tagged >1
+        avail_images = {}
+        for image in docker_client.images.list():
+            for image_tag in image.tags:
+                name, _, tag = image_tag.partition(':')
+                avail_images.setdefault(name, []).append(tag)
+
+        docker_containers['restapi']['imageavailable'] = docker_containers['restapi']['imagename'] in avail_images
+        docker_containers['webapp']['imageavailable'] = docker_containers['webapp']['imagename'] in avail_images
+        docker_containers['swagger']['imageavailable'] = docker_containers['swagger']['imagename'] in avail_images
 
         # Need at minimum the rest api container!
         if not docker_containers['restapi']['imageavailable']:
@@ -1399,149 +1798,143 @@ def main():
                 f'\n{Colors.BLUE}INFO:{Colors.COLEND} Cannot access Docker Hub but a REST API server image is available to use (minimum requirement)...')
 
             # Find the newest tag for each available image and change the docker_containers['restapi']['tag'] for each image
+            # Only need to do this if an image is available, the tags were already collected from the local images above
             for k in docker_containers.keys():
-                # Only need to do this if an image is available
                 if docker_containers[k]["imageavailable"]:
-                    images = docker_client.images.list(name=docker_containers[k]["imagename"])
-
-                    images_to_sort = []
-                    for image in images:
-                        # If there is > 1 images found remove latest to find the true 'latest' version and don't rely on the meaningless latest tag
-                        if len(images) > 1 and 'latest' in image.attrs["RepoTags"][0]:
-                            continue
-                        images_to_sort.append(image.attrs["RepoTags"][0])
+                    tags = avail_images[docker_containers[k]["imagename"]]
 
-                    images_to_sort.sort(reverse=True)
-                    _, tag = images_to_sort[0].split(':')
+                    # If there is > 1 tags found remove latest to find the true 'latest' version and don't rely on the meaningless latest tag
+                    if len(tags) > 1:
+                        tags = [tag for tag in tags if 'latest' not in tag] or tags
 
-                    docker_containers[k]['tag'] = tag
+                    # Newest by version order in a single pass, e.g. 2.10.0 is newer than 2.9.0
+                    docker_containers[k]['tag'] = max(tags, key=version_key)
 
     # Fix ini parms for mounting inside container, when db type is sqlite also perform cluster checks and return an additional
     # mount to use to mount the sqlite file(s) into the container.
     db_type, ini_json_patched, sqlite_mount = patch_ini_json(ini_json)
 
-    # Perform checks needed for mysql
-    if db_type.lower() == 'mysql':
-        mysql_check(SENZING_ROOT, LIB_MY_SQL, db_type, SENZING_SUPPORT)
+    # Perform checks needed for the database type, before writing the INI parms with the connection string to a file
+    db_kind = db_type.lower()
+    db_checks = {'mysql': partial(mysql_check, SENZING_ROOT, LIB_MY_SQL, db_type, SENZING_SUPPORT),
+                 'db2': partial(db2_check, args, SENZING_SUPPORT),
+                 'mssql': mssql_check}
 
-    # Perform checks needed for Db2
-    if db_type.lower() == 'db2':
-        db2_check(args, SENZING_SUPPORT)
+    if db_kind in db_checks:
+        db_checks[db_kind]()
 
-    if db_type == 'mssql':
-        print(f'\n{Colors.ERROR}ERROR:{Colors.COLEND} MSSQL databases are not supported currently')
-        sys.exit(1)
+    # Look up the user once, the user that ran sudo if running with sudo --preserve-env
+    run_user = pwd.getpwnam(os.getenv('SUDO_USER') or os.getenv('USER'))
 
     # Write INI parms to file, could use init-json string but less secure
     # Writing to file inside the project allows only those authorised to use project to see connection string
     ini_json_file = str(ini_file_name) + '_SzGo.json'
-    with open(pathlib.Path(ini_json_file), 'w') as f:
-        json.dump(ini_json_patched, f)
+    ini_json_text = json.dumps(ini_json_patched)
+
+    # Skip writing the file and setting ownership and permissions if a previous run already wrote the same content
+    # and completed setting them
+    is_root = os.geteuid() == 0
+    ini_json_done = False
+    with suppress(OSError):
+        ini_json_stat = os.stat(ini_json_file)
+        ini_json_done = stat.S_IMODE(ini_json_stat.st_mode) == stat.S_IRUSR | stat.S_IWUSR \
+            and (not is_root or ini_json_stat.st_uid == run_user.pw_uid) \
+            and pathlib.Path(ini_json_file).read_text() == ini_json_text
+
+    if not ini_json_done:
+        # Create the file user read and write only, ownership and permissions are set on the open file before the
+        # connection string is written to it
+        with os.fdopen(os.open(ini_json_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, stat.S_IRUSR | stat.S_IWUSR), 'w') as f:
+
+            # If running with sudo - for Docker - chown the file to the user after sudo creates it. This prevents permissions
+            # errors if a user starts with sudo then no longer needs sudo to run docker, e.g. was added to docker group
+            if is_root:
+                try:
+                    os.fchown(f.fileno(), run_user.pw_uid, run_user.pw_gid)
+                except Exception as ex:
+                    print(MSG_CHOWN.format(Colors=Colors, file_name=ini_json_file, ex=ex))
+                    sys.exit(1)
 
-    # If running with sudo - for Docker - chown the file to the user after sudo creates it. This prevents permissions
-    # errors if a user starts with sudo then no longer needs sudo to run docker, e.g. was added to docker group
-    if os.geteuid() == 0:
-        try:
-            uid = pwd.getpwnam(os.getenv("SUDO_USER")).pw_uid
-            gid = pwd.getpwnam(os.getenv("SUDO_USER")).pw_gid
-            os.chown(ini_json_file, uid, gid)
-        except Exception as ex:
-            print(textwrap.dedent(f'''\n\
-                {Colors.ERROR}ERROR:{Colors.COLEND} Cannot change ownership on {ini_json_file}
-                        {ex}
-                '''))
-            sys.exit(1)
+            # Change permissions for user read and write, the mode used by open only applies when creating the file
+            try:
+                os.fchmod(f.fileno(), stat.S_IRUSR | stat.S_IWUSR)
+            except OSError as ex:
+                print(MSG_CHMOD.format(Colors=Colors, file_name=ini_json_file, ex=ex))
+                sys.exit(1)
 
-    # Change permissions for user read and write
-    try:
-        os.chmod(ini_json_file, stat.S_IRUSR | stat.S_IWUSR)
-    except OSError as ex:
-        print(textwrap.dedent(f'''\n\
-            {Colors.ERROR}ERROR:{Colors.COLEND} Cannot set permissions on {ini_json_file}
-                    {ex}
-                '''))
-        sys.exit(1)
+            f.write(ini_json_text)
 
     # REST Server - this is the minimum container to start, can be started without others
-    api_host_port = args.apiHostPort[0] if isinstance(args.apiHostPort, list) else args.apiHostPort
+    api_host_port = args.apiHostPort
 
     # Base volumes to mount in the container
-    api_volumes = {f'{SENZING_ROOT}': {'bind': '/opt/senzing/g2', 'mode': 'rw'},
-                   f'{SENZING_ROOT}/data': {'bind': '/opt/senzing/data', 'mode': 'rw'},
-                   f'{SENZING_ROOT}/etc': {'bind': '/etc/opt/senzing', 'mode': 'rw'},
-                   }
+    api_volumes = {host_path.format(senzing_root=SENZING_ROOT): {'bind': cont_path, 'mode': 'rw'}
+                   for host_path, cont_path in API_BASE_VOLUMES}
 
     # If db type is sqlite add extra mount for sqlite file(s) into container
     if sqlite_mount:
         api_volumes[sqlite_mount[0]] = sqlite_mount[1]
 
     # If db2 type is Db2 add extra mount for the required CLI drivers
-    if db_type == 'db2':
+    if db_kind == 'db2':
         api_volumes[args.db2CliPath[0]] = {'bind': '/opt/IBM/db2/clidriver', 'mode': 'rw'}
 
     disp_pack_msg = False
 
-    docker_run(docker_client,
-               docker_containers,
-               args.skipHealth,
-               # Docker module docs say can pass a list, doesn't work. Entrypoint for image already specifies the jar to launch
-               command=rest_api_command,
-               container='restapi',
-               detach=True,
-               # Set hostname for use by the web app env var SENZING_API_SERVER_URL
-               hostname=docker_containers['restapi']['containername'],
-               image=docker_containers['restapi']['imagename'] + ':' + docker_containers['restapi']['tag'],
-               name=docker_containers['restapi']['containername'],
-               network=args.dockNet,
-               # Order is: cont: host
-               ports={docker_containers['restapi']['containerport']: api_host_port},
-               remove=False,
-               tty=True,
-               # Get the ID of the user, this ensures the correct uid if starting as sudo --preserve-env
-               # The container uses this uid for files such as G2C.db and write operations
-               user=f'{pwd.getpwnam(os.getenv("SUDO_USER")).pw_uid if os.getenv("SUDO_USER", None) else pwd.getpwnam(os.getenv("USER")).pw_uid}',
-               volumes=api_volumes,
-               # See undocumented arg --apiServerCommand
-               environment=[
-                    f'SENZING_INIT_JSON={os.getenv("SENZING_INIT_JSON", "")}'
-               ]
-               )
-
-    # Try and get the API specification for Swagger, acts as test if it's up correctly too
-    print('\n\tFetching API specification from REST server', end='')
-    api_spec = get_api_spec(f'http://{host_name}:{api_host_port}/{SZGO_REST_SPEC}')
-    print()
-
-    # Dump the specification as JSON for Swagger from the rest server
-    with open(f'{SENZING_ROOT}/var/{SZGO_REST_JSON}', 'w') as spec_file:
-        # Only want the data section from the response - not the metadata
-        json.dump(json.loads(api_spec)['data'], spec_file)
+    # Arguments common to running each of the containers
+    run_container = partial(docker_run,
+                            docker_client,
+                            docker_containers,
+                            args.skipHealth,
+                            detach=True,
+                            network=args.dockNet,
+                            remove=False,
+                            tty=True)
+
+    # Details of each container used to build the run arguments
+    restapi = docker_containers['restapi']
+    webapp = docker_containers['webapp']
+    swagger = docker_containers['swagger']
+
+    # REST API command: Docker module docs say can pass a list, doesn't work. Entrypoint for image already specifies the jar to launch
+    run_container(command=rest_api_command,
+                  container='restapi',
+                  # Set hostname for use by the web app env var SENZING_API_SERVER_URL
+                  hostname=restapi['containername'],
+                  image=restapi['imagename'] + ':' + restapi['tag'],
+                  name=restapi['containername'],
+                  # Order is: cont: host
+                  ports={restapi['containerport']: api_host_port},
+                  # Get the ID of the user, this ensures the correct uid if starting as sudo --preserve-env
+                  # The container uses this uid for files such as G2C.db and write operations
+                  user=f'{run_user.pw_uid}',
+                  volumes=api_volumes,
+                  # See undocumented arg --apiServerCommand
+                  environment=[
+                       f'SENZING_INIT_JSON={os.getenv("SENZING_INIT_JSON", "")}'
+                  ])
 
     # Web App
-    web_app_host_port = args.webAppHostPort[0] if isinstance(args.webAppHostPort, list) else args.webAppHostPort
-
-    if not args.noWebApp and docker_containers['webapp']['imageavailable']:
-
-        docker_run(docker_client,
-                   docker_containers,
-                   args.skipHealth,
-                   container='webapp',
-                   detach=True,
-                   # Use Docker name of the container as the hostname - as per "docker inspect szgo-network"
-                   # Can't rely on the hostname reported by the OS here. This host name is used inside the
-                   # container and if the host name is localhost the entity search app tries to find the API
-                   # Server within itself
-                   environment=[
-                       f'SENZING_API_SERVER_URL=http://{docker_containers["restapi"]["containername"]}:{docker_containers["restapi"]["containerport"]}',
-                       'SENZING_WEB_SERVER_PORT=8081'
-                   ],
-                   image=docker_containers['webapp']['imagename'] + ':' + docker_containers['webapp']['tag'],
-                   name=docker_containers['webapp']['containername'],
-                   network=args.dockNet,
-                   ports={docker_containers['webapp']['containerport']: web_app_host_port},
-                   remove=False,
-                   tty=True
-                   )
+    web_app_host_port = args.webAppHostPort
+
+    # The web app and Swagger only depend on the REST server, they are started concurrently below
+    webapp_run = swagger_run = None
+
+    if not args.noWebApp and webapp['imageavailable']:
+
+        webapp_run = partial(run_container,
+                             container='webapp',
+                             # Use Docker name of the container as the hostname - as per "docker inspect szgo-network"
+                             # Can't rely on the hostname reported by the OS here. This host name is used inside the
+                             # container and if the host name is localhost the entity search app tries to find the API
+                             # Server within itself
+                             environment=[
+                                 f'SENZING_API_SERVER_URL=http://{restapi["containername"]}:{restapi["containerport"]}',
+                                 'SENZING_WEB_SERVER_PORT=8081'
+                             ],
+                             image=webapp['imagename'] + ':' + webapp['tag'],
+                             name=webapp['containername'],
+                             ports={webapp['containerport']: web_app_host_port})
     else:
         if not args.noWebApp:
             print(
@@ -1549,24 +1942,17 @@ def main():
             disp_pack_msg = True
 
     # Swagger
-    swagger_host_port = args.swaggerHostPort[0] if isinstance(args.swaggerHostPort, list) else args.swaggerHostPort
-
-    if not args.noSwagger and docker_containers['swagger']['imageavailable']:
-
-        docker_run(docker_client,
-                   docker_containers,
-                   args.skipHealth,
-                   container='swagger',
-                   detach=True,
-                   environment=[f'SWAGGER_JSON=/var/tmp/{SZGO_REST_JSON}'],
-                   image=docker_containers['swagger']['imagename'] + ':' + docker_containers['swagger']['tag'],
-                   name=docker_containers['swagger']['containername'],
-                   network=args.dockNet,
-                   ports={docker_containers['swagger']['containerport']: swagger_host_port},
-                   remove=False,
-                   tty=True,
-                   volumes={f'{SENZING_VAR_PATH}/{SZGO_REST_JSON}': {'bind': f'/var/tmp/{SZGO_REST_JSON}', 'mode': 'ro'}}
-                   )
+    swagger_host_port = args.swaggerHostPort
+
+    if not args.noSwagger and swagger['imageavailable']:
+
+        swagger_run = partial(run_container,
+                              container='swagger',
+                              environment=[f'SWAGGER_JSON=/var/tmp/{SZGO_REST_JSON}'],
+                              image=swagger['imagename'] + ':' + swagger['tag'],
+                              name=swagger['containername'],
+                              ports={swagger['containerport']: swagger_host_port},
+                              volumes={f'{SENZING_VAR_PATH}/{SZGO_REST_JSON}': {'bind': f'/var/tmp/{SZGO_REST_JSON}', 'mode': 'ro'}})
 
     else:
         if not args.noSwagger:
@@ -1574,43 +1960,51 @@ def main():
                 f'\n{Colors.WARN}WARNING:{Colors.COLEND} Can\'t access web resources and no existing Swagger Docker image exists, can\'t start Swagger container.')
             disp_pack_msg = True
 
+    # Try and get the API specification for Swagger, acts as test if it's up correctly too. Fetched before starting
+    # the other containers, if the REST server isn't serving it there is no point in starting them
+    print('\n\tFetching API specification from REST server', end='')
+    api_spec = get_api_spec(f'http://{host_name}:{api_host_port}/{SZGO_REST_SPEC}')
+    print()
+
+    # Dump the specification as JSON for Swagger from the rest server, serialised then written in one go
+    # Only want the data section from the response - not the metadata
+    if orjson:
+        pathlib.Path(f'{SENZING_ROOT}/var/{SZGO_REST_JSON}').write_bytes(orjson.dumps(orjson.loads(api_spec)['data']))
+    else:
+        pathlib.Path(f'{SENZING_ROOT}/var/{SZGO_REST_JSON}').write_text(json.dumps(json.loads(api_spec)['data']))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(run) for run in (webapp_run, swagger_run) if run]
+
+        # result() re-raises any failure, e.g. the SystemExit from docker_run if a container can't be started
+        for future in as_completed(futures):
+            future.result()
+
     if disp_pack_msg:
         package_msg()
 
-    api_server_url = f'http://{host_name}:{api_host_port}'
-    api_server_ip = f'http://{ip_addr}:{api_host_port}'
+    # URL using the host name and URL using the IP address for each container
+    host_ports = {'restapi': api_host_port, 'webapp': web_app_host_port, 'swagger': swagger_host_port}
+    endpoints = {key: (f'http://{host_name}:{port}', f'http://{ip_addr}:{port}') for key, port in host_ports.items()}
 
-    if not args.noWebApp and (docker_containers['webapp']['startedok'] or args.skipHealth):
-        entity_search_url = f'http://{host_name}:{web_app_host_port}'
-        entity_search_ip = f'http://{ip_addr}:{web_app_host_port}'
-    else:
-        entity_search_url = '--noWebApp (-nwa) used or an error occurred'
-        entity_search_ip = Format.CURSOR_UP
+    if args.noWebApp or not (webapp['startedok'] or args.skipHealth):
+        endpoints['webapp'] = ('--noWebApp (-nwa) used or an error occurred', Format.CURSOR_UP)
 
-    if not args.noSwagger and (docker_containers['swagger']['startedok'] or args.skipHealth):
-        swagger_url = f'http://{host_name}:{swagger_host_port}'
-        swagger_ip = f'http://{ip_addr}:{swagger_host_port}'
-    else:
-        swagger_url = '--noSwagger (-nsw) used or an error occurred'
-        swagger_ip = Format.CURSOR_UP
-
-    print(textwrap.dedent(f'''\n\n\
-        {Colors.BLUE}{Colors.BOLD}Resources
-        ---------{Colors.COLEND}
-        
-        {Colors.INFO + 'INFO:' + Colors.COLEND + ' Skip health check was specified, resources may not be immediately available.' + Format.NEWLINE if args.skipHealth else Format.CURSOR_UP}
-        REST API Server: {api_server_url}
-                         {api_server_ip}
-                         
-        Web App demo:    {entity_search_url}
-                         {entity_search_ip}
-                         
-        Swagger GUI:     {swagger_url}
-                         {swagger_ip}
-                         
-        {Colors.INFO + 'INFO:' + Colors.COLEND + ' Appear to be running on a cloud system, ensure access to resources and ports are open!'  + Format.NEWLINE if is_cloud else Format.CURSOR_UP}
-        {Colors.GREEN}Help:{Colors.COLEND} {SZGO_HELP}
-            '''))
+    if args.noSwagger or not (swagger['startedok'] or args.skipHealth):
+        endpoints['swagger'] = ('--noSwagger (-nsw) used or an error occurred', Format.CURSOR_UP)
+
+    skip_health_note = f'{Colors.INFO}INFO:{Colors.COLEND} Skip health check was specified, resources may not be immediately available.\n' \
+        if args.skipHealth else Format.CURSOR_UP
+    cloud_note = f'{Colors.INFO}INFO:{Colors.COLEND} Appear to be running on a cloud system, ensure access to resources and ports are open!\n' \
+        if is_cloud else Format.CURSOR_UP
+
+    # Written and flushed as a single block
+    sys.stdout.write(MSG_RESOURCES.format(Colors=Colors,
+                                          skip_health_note=skip_health_note,
+                                          endpoints=endpoints,
+                                          cloud_note=cloud_note,
+                                          help_url=SZGO_HELP) + '\n')
+    sys.stdout.flush()
 
 
 if __name__ == '__main__':